@@ -3,6 +3,7 @@
 from google.adk import Agent
 from ...tools.goal_tracking_tools import (
     track_goal_progress,
+    track_all_goals,
     project_goal_timeline,
     suggest_goal_adjustments,
     calculate_required_savings
@@ -91,6 +92,7 @@ Remember: Goals give investments meaning. Help clients connect their portfolio p
     output_key="goal_tracking_output",
     tools=[
         track_goal_progress,
+        track_all_goals,
         project_goal_timeline, 
         suggest_goal_adjustments,
         calculate_required_savings
@@ -102,11 +102,25 @@ class MockCustodianAPI(BaseMockAPI):
         if account_id not in self._accounts:
             return self._create_response(error=f"Account {account_id} not found")
         
-        account_data = self._accounts[account_id].copy()
-        account_data["cash_balance"] = float(account_data["cash_balance"])
-        account_data["total_value"] = float(account_data["total_value"])
+        return self._create_response(data=self._account_data(account_id))
+    
+    def get_account_info_batch(self, account_ids: List[str]) -> APIResponse:
+        """Get account information for several accounts in a single request
+        
+        Unknown account IDs are omitted from the returned ``accounts`` mapping.
+        """
+        self._simulate_network_delay()
+        
+        if self._simulate_occasional_failure():
+            return self._create_response(error="Failed to fetch account info batch")
         
-        return self._create_response(data=account_data)
+        return self._create_response(data={
+            "accounts": {
+                account_id: self._account_data(account_id)
+                for account_id in account_ids
+                if account_id in self._accounts
+            }
+        })
     
     def get_positions(self, account_id: str) -> APIResponse:
         """Get account positions"""
@@ -118,23 +132,52 @@ class MockCustodianAPI(BaseMockAPI):
         if account_id not in self._positions:
             return self._create_response(error=f"Account {account_id} not found")
         
-        positions_data = []
-        for position in self._positions[account_id]:
-            positions_data.append({
+        return self._create_response(data={
+            "account_id": account_id,
+            "positions": self._positions_data(account_id),
+            "total_market_value": sum(float(pos.market_value) for pos in self._positions[account_id]),
+            "as_of_date": datetime.utcnow().isoformat()
+        })
+    
+    def get_positions_batch(self, account_ids: List[str]) -> APIResponse:
+        """Get positions for several accounts in a single request
+        
+        Unknown account IDs are omitted from the returned ``positions`` mapping.
+        """
+        self._simulate_network_delay()
+        
+        if self._simulate_occasional_failure():
+            return self._create_response(error="Failed to fetch positions batch")
+        
+        return self._create_response(data={
+            "positions": {
+                account_id: self._positions_data(account_id)
+                for account_id in account_ids
+                if account_id in self._positions
+            },
+            "as_of_date": datetime.utcnow().isoformat()
+        })
+    
+    def _account_data(self, account_id: str) -> Dict[str, Any]:
+        """Serialize an account record for API responses"""
+        account_data = self._accounts[account_id].copy()
+        account_data["cash_balance"] = float(account_data["cash_balance"])
+        account_data["total_value"] = float(account_data["total_value"])
+        return account_data
+    
+    def _positions_data(self, account_id: str) -> List[Dict[str, Any]]:
+        """Serialize an account's positions for API responses"""
+        return [
+            {
                 "symbol": position.symbol,
                 "quantity": float(position.quantity),
                 "market_value": float(position.market_value),
                 "cost_basis": float(position.cost_basis),
                 "unrealized_gain_loss": float(position.unrealized_gain_loss),
                 "last_updated": position.last_updated.isoformat()
-            })
-        
-        return self._create_response(data={
-            "account_id": account_id,
-            "positions": positions_data,
-            "total_market_value": sum(float(pos.market_value) for pos in self._positions[account_id]),
-            "as_of_date": datetime.utcnow().isoformat()
-        })
+            }
+            for position in self._positions[account_id]
+        ]
     
     def get_transactions(
         self, 
@@ -4,10 +4,12 @@ from .financial_calculations import FinancialCalculator
 from .risk_analytics import RiskAnalyzer
 from .portfolio_utils import PortfolioAnalyzer
 from .compliance_utils import ComplianceChecker
+from .cache_utils import TTLCache
 
 __all__ = [
     "FinancialCalculator",
     "RiskAnalyzer", 
     "PortfolioAnalyzer",
-    "ComplianceChecker"
+    "ComplianceChecker",
+    "TTLCache"
 ]
\ No newline at end of file
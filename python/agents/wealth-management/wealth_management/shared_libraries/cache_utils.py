@@ -0,0 +1,59 @@
+"""In-process caching utilities for wealth management tools"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Time-to-live for every tool-level cache of API reads, so different tools
+# never serve the same custodian or market data at different staleness
+API_CACHE_TTL_SECONDS = 30.0
+
+
+class TTLCache:
+    """Bounded key/value cache whose entries expire after a fixed time-to-live"""
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache value under key for ttl_seconds"""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._evict()
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        """Make room for one entry; caller must hold the lock"""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+        if len(self._entries) >= self.maxsize:
+            # Dicts preserve insertion order, so the first key is the oldest write
+            del self._entries[next(iter(self._entries))]
@@ -11,6 +11,7 @@ from ..tools.crisis_response_tools import (
     provide_behavioral_coaching,
     prepare_scenario_analysis,
     coordinate_emergency_meeting,
+    coordinate_emergency_meetings,
     document_crisis_interaction
 )
 from ..tools.memory_tools import (
@@ -128,7 +129,7 @@ crisis_documentation_agent = Agent(
     instruction="""You are a crisis documentation specialist. Your role is to:
 
 1. Document all crisis interactions using document_crisis_interaction tool
-2. Coordinate emergency meetings using coordinate_emergency_meeting tool  
+2. Coordinate emergency meetings using coordinate_emergency_meeting tool (or coordinate_emergency_meetings when several meetings are needed at once)
 3. Ensure proper record-keeping for regulatory and follow-up purposes
 4. Maintain detailed timeline of crisis response
 
@@ -136,6 +137,7 @@ Focus on comprehensive documentation and stakeholder coordination.""",
     tools=[
         document_crisis_interaction,
         coordinate_emergency_meeting,
+        coordinate_emergency_meetings,
         store_conversation_context,
     ],
     after_agent_callback=finalize_crisis_response,
@@ -14,6 +14,7 @@ from ..tools.portfolio_tools import (
 )
 from ..tools.goal_tracking_tools import (
     track_goal_progress,
+    track_all_goals,
     project_goal_timeline,
     suggest_goal_adjustments
 )
@@ -86,7 +87,7 @@ goal_tracking_agent = Agent(
     description="Tracks progress toward client goals and suggests adjustments as needed.",
     instruction="""You are a goal tracking specialist. Your role is to:
 
-1. Track goal progress using track_goal_progress tool
+1. Track goal progress using track_all_goals tool (or track_goal_progress for a single goal)
 2. Project goal timelines using project_goal_timeline tool  
 3. Suggest goal adjustments using suggest_goal_adjustments tool if needed
 4. Identify goals that may be at risk
@@ -95,6 +96,7 @@ goal_tracking_agent = Agent(
 Focus on proactive goal management and realistic timeline projections.""",
     tools=[
         track_goal_progress,
+        track_all_goals,
         project_goal_timeline,
         suggest_goal_adjustments,
         get_current_account,
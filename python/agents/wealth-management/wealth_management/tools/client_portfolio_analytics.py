@@ -3,13 +3,16 @@ Comprehensive Client Portfolio Analytics Tools
 Provides insights across all managed clients for relationship managers
 """
 
-import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import copy
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Final, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from datetime import datetime
+import numpy as np
 from google.adk.tools import ToolContext
 from ..mock_apis.custodian_api import MockCustodianAPI
-from ..mock_apis.market_data_api import MockMarketDataAPI  
-from ..mock_apis.crm_api import MockCRMAPI
+from ..shared_libraries.cache_utils import API_CACHE_TTL_SECONDS, TTLCache
 
 # Simple utility classes for analytics
 class PortfolioAnalyzer:
@@ -25,21 +28,448 @@ class PortfolioAnalyzer:
     def calculate_volatility(returns: List[float]) -> float:
         if len(returns) < 2:
             return 0.0
-        import statistics
-        return statistics.stdev(returns)
+        # Sample standard deviation (ddof=1), matching statistics.stdev
+        return float(np.std(np.asarray(returns, dtype=np.float64), ddof=1))
 
 class FinancialCalculator:
     """Simple financial calculation utilities"""
     
     @staticmethod
     def present_value(future_value: float, rate: float, periods: float) -> float:
+        """Discount a value; NumPy array arguments broadcast over whole schedules"""
         return future_value / ((1 + rate) ** periods)
     
     @staticmethod
     def future_value(present_value: float, rate: float, periods: float) -> float:
+        """Compound a value; NumPy array arguments broadcast over whole schedules"""
         return present_value * ((1 + rate) ** periods)
 
 
+# Simulated advisor book (in reality would come from advisor assignment)
+_CLIENT_ACCOUNTS: Final[Tuple[str, ...]] = (
+    "TEST001", "DEMO001", "CLIENT001",
+    "WM100001", "WM100002", "WM100003", "WM100004", "WM100005",
+    "WM100006", "WM100007", "WM100008", "WM100009", "WM100010"
+)
+_CONTENT_CLIENT_ACCOUNTS: Final[Tuple[str, ...]] = _CLIENT_ACCOUNTS[:8]
+
+class _PositionsSoA(NamedTuple):
+    """Column-oriented view of a positions list, money columns in int64 cents"""
+    symbols: List[str]
+    market_value_cents: np.ndarray
+    unrealized_cents: np.ndarray
+    cost_basis_cents: np.ndarray
+
+
+def _to_cents(dollars: np.ndarray) -> np.ndarray:
+    return np.rint(dollars * 100).astype(np.int64)
+
+
+def _positions_soa(positions: List[Dict[str, Any]]) -> _PositionsSoA:
+    """Convert custodian positions (list of dicts) into integer-cent columns"""
+    if not positions:
+        empty = np.zeros(0, dtype=np.int64)
+        return _PositionsSoA([], empty, empty, empty)
+    
+    # Single pass over the positions, one plain tuple of fields per row
+    rows = [
+        (
+            pos.get("symbol", ""),
+            pos.get("market_value", 0),
+            pos.get("unrealized_gain_loss", 0),
+            pos.get("cost_basis", 1),
+        )
+        for pos in positions
+    ]
+    symbols, market_values, unrealized, cost_basis = zip(*rows)
+    return _PositionsSoA(
+        symbols=list(symbols),
+        market_value_cents=_to_cents(np.array(market_values, dtype=np.float64)),
+        unrealized_cents=_to_cents(np.array(unrealized, dtype=np.float64)),
+        cost_basis_cents=_to_cents(np.array(cost_basis, dtype=np.float64)),
+    )
+
+
+# Bound once and shared by the tools below for dollar amounts
+_fmt_usd = "${:,.2f}".format
+
+# Upper bound on concurrent custodian requests issued by _request_accounts
+_MAX_FETCH_WORKERS = 16
+
+# Shared custodian client, so cached and freshly fetched accounts come from
+# the same mock data
+_CUSTODIAN = MockCustodianAPI()
+
+# (account info, positions SoA) per account ID, shared across the tools below
+_ACCOUNT_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS)
+
+# Accounts with fewer positions than this are totalled without NumPy
+_SMALL_ACCOUNT_POSITIONS = 8
+
+
+def _portfolio_totals(soa: _PositionsSoA) -> Tuple[int, int]:
+    """Total market value and total unrealized loss (<= 0), both in cents"""
+    position_count = len(soa.symbols)
+    if not position_count:
+        return 0, 0
+    
+    # For a handful of positions NumPy's per-call overhead outweighs the
+    # vectorized sum, so add up plain Python ints instead
+    if position_count < _SMALL_ACCOUNT_POSITIONS:
+        return (
+            sum(soa.market_value_cents.tolist()),
+            sum(cents for cents in soa.unrealized_cents.tolist() if cents < 0),
+        )
+    
+    # Larger accounts: sum the int64 columns directly, clipping gains to zero
+    # so only losses count
+    return (
+        int(soa.market_value_cents.sum()),
+        int(np.minimum(soa.unrealized_cents, 0).sum()),
+    )
+
+
+# Severity bands over loss in basis points: below -10% is high, below -5% medium
+_SEVERITY_BOUNDS_BPS = (-1000, -500)
+_SEVERITY_LABELS = ("high", "medium", "low")
+
+
+def _classify_severity(loss_bps: int) -> str:
+    """Map loss in basis points to an impact severity label"""
+    return _SEVERITY_LABELS[bisect_right(_SEVERITY_BOUNDS_BPS, loss_bps)]
+
+
+def _fetch_accounts(
+    custodian_api: MockCustodianAPI,
+    account_ids: Tuple[str, ...]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, _PositionsSoA]]:
+    """
+    Fetch account info and columnar positions for many accounts, serving
+    repeat requests from _ACCOUNT_CACHE so sibling tools in the same agent
+    turn share one custodian round trip and one _positions_soa conversion.
+    
+    Accounts that could not be fetched are absent from the returned mappings.
+    
+    Returns:
+        (account info by account ID, positions SoA by account ID)
+    """
+    accounts: Dict[str, Dict[str, Any]] = {}
+    positions: Dict[str, _PositionsSoA] = {}
+    missing = []
+    for account_id in account_ids:
+        cached = _ACCOUNT_CACHE.get(account_id)
+        if cached is None:
+            missing.append(account_id)
+        else:
+            accounts[account_id], positions[account_id] = cached
+    
+    if missing:
+        fetched_accounts, fetched_positions = _request_accounts(custodian_api, missing)
+        for account_id, account_positions in fetched_positions.items():
+            positions[account_id] = _positions_soa(account_positions)
+        for account_id in missing:
+            if account_id in fetched_accounts and account_id in positions:
+                _ACCOUNT_CACHE.set(account_id, (fetched_accounts[account_id], positions[account_id]))
+        accounts.update(fetched_accounts)
+    
+    return accounts, positions
+
+
+def _request_accounts(
+    custodian_api: MockCustodianAPI,
+    account_ids: List[str]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Request account info and positions using the custodian batch endpoints,
+    falling back to per-account requests when a batch request fails.
+    
+    The two batch requests, and any per-account fallback requests, are
+    I/O-bound and are issued concurrently from a thread pool.
+    """
+    with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as executor:
+        accounts_future = executor.submit(custodian_api.get_account_info_batch, account_ids)
+        positions_future = executor.submit(custodian_api.get_positions_batch, account_ids)
+        accounts_response = accounts_future.result()
+        positions_response = positions_future.result()
+        
+        if accounts_response.success:
+            accounts = accounts_response.data["accounts"]
+        else:
+            accounts = {
+                account_id: response.data
+                for account_id, response in zip(
+                    account_ids, executor.map(custodian_api.get_account_info, account_ids)
+                )
+                if response.success
+            }
+        
+        if positions_response.success:
+            positions = positions_response.data["positions"]
+        else:
+            positions = {
+                account_id: response.data.get("positions", [])
+                for account_id, response in zip(
+                    account_ids, executor.map(custodian_api.get_positions, account_ids)
+                )
+                if response.success
+            }
+    
+    return accounts, positions
+
+
+# Opportunity categories evaluated for each identify_enhancement_opportunities
+# focus_area; "all" and unrecognised values evaluate every category
+_ALL_OPPORTUNITY_CATEGORIES = frozenset({
+    "portfolio_optimization", "risk_management", "tax_efficiency",
+    "product_expansion", "fee_optimization"
+})
+_FOCUS_AREA_CATEGORIES = MappingProxyType({
+    "performance": frozenset({"portfolio_optimization"}),
+    "risk": frozenset({"risk_management"}),
+    "allocation": frozenset({"portfolio_optimization", "product_expansion"}),
+    "tax": frozenset({"tax_efficiency"}),
+})
+
+# Static mock payloads, built once at import. The nested dicts are shared
+# across calls, so tools hand out deep copies rather than the tables themselves
+_HELP_DESK_TEMPLATE = MappingProxyType({
+    "total_requests": 247,
+    "avg_requests_per_day": 2.7,
+    "resolution_metrics": {
+        "avg_resolution_time": "4.2 hours",
+        "first_contact_resolution": "68%",
+        "customer_satisfaction": "4.3/5.0"
+    },
+    "request_categories": {
+        "account_access": {"count": 89, "percentage": "36%", "avg_resolution": "2.1 hours"},
+        "investment_questions": {"count": 67, "percentage": "27%", "avg_resolution": "6.4 hours"},
+        "technical_issues": {"count": 45, "percentage": "18%", "avg_resolution": "3.8 hours"},
+        "fee_inquiries": {"count": 28, "percentage": "11%", "avg_resolution": "1.9 hours"},
+        "document_requests": {"count": 18, "percentage": "8%", "avg_resolution": "24.2 hours"}
+    },
+    "trending_issues": (
+        {
+            "issue": "Mobile app login difficulties",
+            "requests": 34,
+            "trend": "increasing",
+            "impact": "high",
+            "recommended_action": "Update mobile app authentication flow"
+        },
+        {
+            "issue": "Market volatility concerns",
+            "requests": 28,
+            "trend": "stable",
+            "impact": "medium",
+            "recommended_action": "Proactive market education campaign"
+        },
+        {
+            "issue": "ESG investment options requests",
+            "requests": 22,
+            "trend": "increasing",
+            "impact": "medium",
+            "recommended_action": "Expand ESG product offerings"
+        }
+    ),
+    "client_specific_patterns": (
+        {
+            "pattern": "High-net-worth clients requesting alternative investments",
+            "affected_clients": 12,
+            "avg_requests_per_client": 3.2,
+            "recommendation": "Develop alternative investment educational materials"
+        },
+        {
+            "pattern": "Retirees asking about income generation strategies",
+            "affected_clients": 18,
+            "avg_requests_per_client": 2.8,
+            "recommendation": "Create retirement income planning workshops"
+        },
+        {
+            "pattern": "Younger clients inquiring about robo-advisor integration",
+            "affected_clients": 8,
+            "avg_requests_per_client": 4.1,
+            "recommendation": "Evaluate digital investment platform integration"
+        }
+    ),
+    "proactive_recommendations": (
+        {
+            "recommendation": "Implement chatbot for common account access issues",
+            "potential_impact": "Reduce 40% of account access requests",
+            "implementation_timeline": "2-3 months"
+        },
+        {
+            "recommendation": "Create video library for investment education",
+            "potential_impact": "Reduce investment question call volume by 25%",
+            "implementation_timeline": "1-2 months"
+        },
+        {
+            "recommendation": "Proactive client communication during market volatility",
+            "potential_impact": "Reduce anxiety-driven calls by 35%",
+            "implementation_timeline": "Immediate"
+        }
+    )
+})
+
+# request_category filter values mapped to their help desk category key
+_HELP_DESK_CATEGORY_KEYS = {
+    "account": "account_access",
+    "investment": "investment_questions",
+    "technical": "technical_issues",
+}
+
+_HELP_DESK_CATEGORY_VIEWS = MappingProxyType({
+    category: MappingProxyType({
+        **_HELP_DESK_TEMPLATE,
+        "request_categories": {key: _HELP_DESK_TEMPLATE["request_categories"][key]}
+    })
+    for category, key in _HELP_DESK_CATEGORY_KEYS.items()
+})
+
+_OUTREACH_COMMUNICATION_TEMPLATES = MappingProxyType({
+    "market_volatility_comfort_call": {
+        "subject": "Portfolio Review - Navigating Market Volatility",
+        "opening": "I wanted to reach out personally regarding the recent market movements and their impact on your portfolio...",
+        "key_points": (
+            "Current market conditions context",
+            "Your portfolio's defensive positioning",
+            "Long-term investment perspective",
+            "Any questions or concerns you might have"
+        ),
+        "call_to_action": "Would you like to schedule a brief call this week to discuss?"
+    },
+    "investment_opportunity": {
+        "subject": "Investment Opportunities in Current Market Environment",
+        "opening": "Given the current market conditions, I've identified some strategic opportunities that align with your investment objectives...",
+        "key_points": (
+            "Cash deployment strategies",
+            "Attractive entry points in quality securities",
+            "Rebalancing opportunities",
+            "Tax-efficient investment approaches"
+        ),
+        "call_to_action": "Let's schedule a call to review these opportunities together"
+    },
+    "relationship_maintenance": {
+        "subject": "Quarterly Portfolio Review - Let's Connect",
+        "opening": "I hope you're doing well. It's been a while since we last spoke, and I'd love to catch up and review your portfolio performance...",
+        "key_points": (
+            "Portfolio performance update",
+            "Any changes in your financial situation",
+            "Upcoming financial planning opportunities",
+            "Market outlook and strategy adjustments"
+        ),
+        "call_to_action": "Would next week work for a portfolio review meeting?"
+    }
+})
+
+_CONTENT_LIBRARY = MappingProxyType({
+    "educational_materials": (
+        "Investment Basics Series",
+        "Risk Management Fundamentals",
+        "Market Analysis Training",
+        "Financial Planning 101"
+    ),
+    "planning_tools": (
+        "Retirement Planning Calculator",
+        "Risk Assessment Questionnaire",
+        "Tax Loss Harvesting Optimizer",
+        "Asset Allocation Modeler"
+    ),
+    "market_insights": (
+        "Weekly Market Commentary",
+        "Quarterly Economic Outlook",
+        "Sector Analysis Reports",
+        "Fed Policy Impact Analysis"
+    )
+})
+
+_TRENDING_CONTENT = (
+    MappingProxyType({
+        "title": "Navigating Market Volatility: A Long-term Perspective",
+        "type": "market_commentary",
+        "relevance": "All clients experiencing portfolio declines",
+        "format": "PDF report + video explanation"
+    }),
+    MappingProxyType({
+        "title": "Tax Loss Harvesting Strategies for 2024",
+        "type": "tax_planning",
+        "relevance": "Clients with unrealized losses",
+        "format": "Interactive calculator + guide"
+    }),
+    MappingProxyType({
+        "title": "ESG Investing: Aligning Values with Returns",
+        "type": "investment_education",
+        "relevance": "Clients interested in sustainable investing",
+        "format": "Webinar series + fact sheets"
+    })
+)
+
+# Personalized content entries; each suggestion gets its own dict copy
+_CONTENT_LONG_TERM = MappingProxyType({
+    "category": "long_term_planning",
+    "title": "Building Wealth in Your 30s and 40s",
+    "description": "Strategies for accumulating wealth during peak earning years",
+    "format": "E-book + planning worksheets",
+    "priority": "medium"
+})
+
+_CONTENT_PRE_RETIREMENT = MappingProxyType({
+    "category": "retirement_planning",
+    "title": "Pre-Retirement Checklist: 10 Years to Go",
+    "description": "Essential steps to prepare for retirement",
+    "format": "Checklist + retirement calculator",
+    "priority": "high"
+})
+
+_CONTENT_MARKET_EDUCATION = MappingProxyType({
+    "category": "market_education",
+    "title": "Understanding Market Cycles and Your Portfolio",
+    "description": "Historical context and coping strategies for market downturns",
+    "format": "Video series + historical data charts",
+    "priority": "high"
+})
+
+_CONTENT_CASH_DEPLOYMENT = MappingProxyType({
+    "category": "investment_strategy",
+    "title": "Smart Cash Deployment Strategies",
+    "description": "Techniques for putting excess cash to work efficiently",
+    "format": "Interactive guide + opportunity scanner",
+    "priority": "medium"
+})
+
+_CONTENT_IRA = MappingProxyType({
+    "category": "tax_planning",
+    "title": "IRA Optimization Strategies",
+    "description": "Maximizing tax advantages and planning distributions",
+    "format": "Tax calculator + strategy guide",
+    "priority": "medium"
+})
+
+_CONTENT_HNW_PLANNING = MappingProxyType({
+    "category": "advanced_planning",
+    "title": "High Net Worth Planning Strategies",
+    "description": "Estate planning, tax optimization, and philanthropic giving",
+    "format": "Comprehensive planning guide + case studies",
+    "priority": "medium"
+})
+
+_CONTENT_ALTERNATIVES = MappingProxyType({
+    "category": "alternative_investments",
+    "title": "Alternative Investment Opportunities",
+    "description": "Private equity, hedge funds, and real estate investments",
+    "format": "Market analysis + due diligence framework",
+    "priority": "low"
+})
+
+# Age-based content by age band: under 40, 40 to 55, over 55 (whole years)
+_AGE_BREAKS = (40, 56)
+_AGE_CONTENT = (_CONTENT_LONG_TERM, None, _CONTENT_PRE_RETIREMENT)
+
+# Content triggers: unrealized loss and cash as a fraction of portfolio value,
+# and the portfolio value above which a client counts as high net worth
+_LOSS_THRESHOLD = 0.05
+_CASH_THRESHOLD = 0.10
+_HNW_THRESHOLD = 1_000_000.0
+
+
 def analyze_market_impact_across_clients(
     advisor_id: Optional[str] = None,
     time_period: str = "3M",
@@ -56,20 +486,12 @@ def analyze_market_impact_across_clients(
     Returns:
         Comprehensive market impact analysis across client portfolio
     """
-    custodian_api = MockCustodianAPI()
-    market_api = MockMarketDataAPI()
-    crm_api = MockCRMAPI()
-    
     # Get all client accounts (simulated - in reality would come from advisor assignment)
-    client_accounts = [
-        "TEST001", "DEMO001", "CLIENT001", 
-        "WM100001", "WM100002", "WM100003", "WM100004", "WM100005",
-        "WM100006", "WM100007", "WM100008", "WM100009", "WM100010"
-    ]
+    client_accounts = _CLIENT_ACCOUNTS
     
     market_impact_analysis = {
         "analysis_period": time_period,
-        "analysis_date": datetime.utcnow().isoformat(),
+        "analysis_date": datetime.now().isoformat(),
         "total_clients_analyzed": len(client_accounts),
         "market_conditions": {
             "market_trend": "volatile_decline",
@@ -88,36 +510,35 @@ def analyze_market_impact_across_clients(
         "opportunity_recommendations": []
     }
     
-    total_aum = 0
-    total_loss = 0
+    total_aum_cents = 0
+    total_loss_cents = 0
     client_details = []
     
+    # Accounts the custodian could not return are simply absent from the map
+    _, positions_by_id = _fetch_accounts(_CUSTODIAN, client_accounts)
+    
     for account_id in client_accounts:
-        # Get account positions
-        positions_response = custodian_api.get_positions(account_id)
-        if not positions_response.success:
+        soa = positions_by_id.get(account_id)
+        if soa is None:
             continue
-            
-        positions = positions_response.data.get("positions", [])
-        portfolio_value = sum(pos.get("market_value", 0) for pos in positions)
-        portfolio_loss = sum(pos.get("unrealized_gain_loss", 0) for pos in positions if pos.get("unrealized_gain_loss", 0) < 0)
         
-        # Calculate impact severity
-        if portfolio_value > 0:
-            loss_percentage = (portfolio_loss / portfolio_value) * 100
+        portfolio_value_cents, portfolio_loss_cents = _portfolio_totals(soa)
+        
+        # Calculate impact severity in integer basis points. Floor division keeps
+        # "< -1000" exactly equivalent to "< -10%" on the unrounded ratio.
+        if portfolio_value_cents > 0:
+            loss_bps = (portfolio_loss_cents * 10_000) // portfolio_value_cents
+            loss_percentage = (portfolio_loss_cents / portfolio_value_cents) * 100
         else:
+            loss_bps = 0
             loss_percentage = 0
             
-        impact_severity = "low"
-        if loss_percentage < -10:
-            impact_severity = "high"
-        elif loss_percentage < -5:
-            impact_severity = "medium"
+        impact_severity = _classify_severity(loss_bps)
         
         client_impact = {
             "account_id": account_id,
-            "portfolio_value": f"${portfolio_value:,.2f}",
-            "unrealized_loss": f"${portfolio_loss:,.2f}",
+            "portfolio_value": _fmt_usd(portfolio_value_cents / 100),
+            "unrealized_loss": _fmt_usd(portfolio_loss_cents / 100),
             "loss_percentage": f"{loss_percentage:.2f}%",
             "impact_severity": impact_severity,
             "top_losing_positions": [],
@@ -125,14 +546,16 @@ def analyze_market_impact_across_clients(
         }
         
         # Analyze top losing positions
-        losing_positions = [pos for pos in positions if pos.get("unrealized_gain_loss", 0) < 0]
-        losing_positions.sort(key=lambda x: x.get("unrealized_gain_loss", 0))
+        unrealized_cents = soa.unrealized_cents
+        losing_idx = np.flatnonzero(unrealized_cents < 0)
+        losing_idx = losing_idx[np.argsort(unrealized_cents[losing_idx], kind="stable")]
         
-        for pos in losing_positions[:3]:  # Top 3 losers
+        for i in losing_idx[:3]:  # Top 3 losers
+            loss_cents = int(unrealized_cents[i])
             client_impact["top_losing_positions"].append({
-                "symbol": pos.get("symbol", ""),
-                "loss": f"${pos.get('unrealized_gain_loss', 0):,.2f}",
-                "loss_pct": f"{(pos.get('unrealized_gain_loss', 0) / pos.get('cost_basis', 1)) * 100:.1f}%"
+                "symbol": soa.symbols[i],
+                "loss": _fmt_usd(loss_cents / 100),
+                "loss_pct": f"{(loss_cents / int(soa.cost_basis_cents[i])) * 100:.1f}%"
             })
         
         # Generate recommendations based on impact
@@ -156,17 +579,17 @@ def analyze_market_impact_across_clients(
             ]
         
         client_details.append(client_impact)
-        total_aum += portfolio_value
-        total_loss += abs(portfolio_loss)
+        total_aum_cents += portfolio_value_cents
+        total_loss_cents -= portfolio_loss_cents
         
         if impact_severity in ["high", "medium"]:
             market_impact_analysis["aggregate_impact"]["clients_with_significant_losses"] += 1
     
     # Update aggregate metrics
-    market_impact_analysis["aggregate_impact"]["total_aum_analyzed"] = f"${total_aum:,.2f}"
-    market_impact_analysis["aggregate_impact"]["total_unrealized_loss"] = f"${total_loss:,.2f}"
-    if total_aum > 0:
-        market_impact_analysis["aggregate_impact"]["average_portfolio_decline"] = f"{(total_loss / total_aum) * 100:.2f}%"
+    market_impact_analysis["aggregate_impact"]["total_aum_analyzed"] = _fmt_usd(total_aum_cents / 100)
+    market_impact_analysis["aggregate_impact"]["total_unrealized_loss"] = _fmt_usd(total_loss_cents / 100)
+    if total_aum_cents > 0:
+        market_impact_analysis["aggregate_impact"]["average_portfolio_decline"] = f"{(total_loss_cents / total_aum_cents) * 100:.2f}%"
     
     market_impact_analysis["client_impact_details"] = client_details
     
@@ -210,18 +633,20 @@ def identify_enhancement_opportunities(
     Returns:
         Enhancement opportunities across client base
     """
-    custodian_api = MockCustodianAPI()
+    client_accounts = _CLIENT_ACCOUNTS
     
-    client_accounts = [
-        "TEST001", "DEMO001", "CLIENT001", 
-        "WM100001", "WM100002", "WM100003", "WM100004", "WM100005",
-        "WM100006", "WM100007", "WM100008", "WM100009", "WM100010"
-    ]
+    # Only evaluate the opportunity checks relevant to the requested focus area
+    categories = _FOCUS_AREA_CATEGORIES.get(focus_area, _ALL_OPPORTUNITY_CATEGORIES)
+    check_cash_drag = "portfolio_optimization" in categories
+    check_concentration = "risk_management" in categories
+    check_tax_loss = "tax_efficiency" in categories
+    check_alternatives = "product_expansion" in categories
+    check_fees = "fee_optimization" in categories
     
     opportunities = {
-        "analysis_date": datetime.utcnow().isoformat(),
+        "analysis_date": datetime.now().isoformat(),
         "focus_area": focus_area,
-        "minimum_aum_threshold": f"${minimum_aum:,.2f}",
+        "minimum_aum_threshold": _fmt_usd(minimum_aum),
         "total_opportunities_identified": 0,
         "potential_additional_revenue": 0,
         "opportunities_by_category": {
@@ -237,30 +662,32 @@ def identify_enhancement_opportunities(
     
     total_revenue_opportunity = 0
     
+    # Get account info and positions; failed accounts are absent from the maps
+    accounts_by_id, positions_by_id = _fetch_accounts(_CUSTODIAN, client_accounts)
+    
     for account_id in client_accounts:
-        # Get account info and positions
-        account_response = custodian_api.get_account_info(account_id)
-        positions_response = custodian_api.get_positions(account_id)
+        account_info = accounts_by_id.get(account_id)
+        soa = positions_by_id.get(account_id)
         
-        if not (account_response.success and positions_response.success):
+        if account_info is None or soa is None:
             continue
-            
-        account_info = account_response.data
-        positions = positions_response.data.get("positions", [])
-        portfolio_value = sum(pos.get("market_value", 0) for pos in positions)
+        
+        market_value_cents = soa.market_value_cents
+        portfolio_value_cents, portfolio_loss_cents = _portfolio_totals(soa)
+        portfolio_value = portfolio_value_cents / 100
         
         if portfolio_value < minimum_aum:
             continue
         
         client_opportunities = {
             "account_id": account_id,
-            "portfolio_value": f"${portfolio_value:,.2f}",
+            "portfolio_value": _fmt_usd(portfolio_value),
             "opportunities": []
         }
         
         # Portfolio Optimization Opportunities
         cash_balance = account_info.get("cash_balance", 0)
-        if cash_balance > portfolio_value * 0.1:  # More than 10% cash
+        if check_cash_drag and cash_balance > portfolio_value * 0.1:  # More than 10% cash
             opportunity = {
                 "type": "cash_drag_optimization",
                 "description": f"High cash balance (${cash_balance:,.2f}) reducing returns",
@@ -275,14 +702,14 @@ def identify_enhancement_opportunities(
             })
         
         # Risk Management - Concentration Risk
-        if positions:
-            largest_position = max(positions, key=lambda x: x.get("market_value", 0))
-            largest_position_pct = (largest_position.get("market_value", 0) / portfolio_value) * 100
+        if check_concentration and soa.symbols:
+            largest = int(np.argmax(market_value_cents))
+            largest_position_pct = (int(market_value_cents[largest]) / portfolio_value_cents) * 100
             
             if largest_position_pct > 25:  # Concentration risk
                 opportunity = {
                     "type": "concentration_risk",
-                    "description": f"Concentrated position in {largest_position.get('symbol', 'unknown')} ({largest_position_pct:.1f}%)",
+                    "description": f"Concentrated position in {soa.symbols[largest] or 'unknown'} ({largest_position_pct:.1f}%)",
                     "potential_benefit": "Improved risk-adjusted returns",
                     "recommended_action": "Gradual diversification strategy",
                     "priority": "high" if largest_position_pct > 40 else "medium"
@@ -294,9 +721,8 @@ def identify_enhancement_opportunities(
                 })
         
         # Tax Efficiency - Tax Loss Harvesting
-        losing_positions = [pos for pos in positions if pos.get("unrealized_gain_loss", 0) < 0]
-        if losing_positions:
-            total_losses = sum(abs(pos.get("unrealized_gain_loss", 0)) for pos in losing_positions)
+        if check_tax_loss and portfolio_loss_cents < 0:
+            total_losses = -portfolio_loss_cents / 100
             if total_losses > 5000:  # Significant tax loss harvesting opportunity
                 opportunity = {
                     "type": "tax_loss_harvesting",
@@ -312,8 +738,8 @@ def identify_enhancement_opportunities(
                 })
         
         # Product Expansion - Alternative Investments
-        if portfolio_value > 500000:  # High net worth threshold
-            has_alternatives = any(pos.get("symbol", "").startswith(("REIT", "PRIV", "HEDGE")) for pos in positions)
+        if check_alternatives and portfolio_value > 500000:  # High net worth threshold
+            has_alternatives = any(symbol.startswith(("REIT", "PRIV", "HEDGE")) for symbol in soa.symbols)
             if not has_alternatives:
                 opportunity = {
                     "type": "alternative_investments",
@@ -330,7 +756,7 @@ def identify_enhancement_opportunities(
         
         # Fee Optimization
         estimated_fees = portfolio_value * 0.01  # Assume 1% fee
-        if portfolio_value > 1000000 and estimated_fees > 10000:  # High-value client
+        if check_fees and portfolio_value > 1000000 and estimated_fees > 10000:  # High-value client
             opportunity = {
                 "type": "fee_optimization",
                 "description": f"Potential for tiered pricing on ${portfolio_value:,.2f} portfolio",
@@ -353,7 +779,7 @@ def identify_enhancement_opportunities(
     opportunities["total_opportunities_identified"] = sum(
         len(cat) for cat in opportunities["opportunities_by_category"].values()
     )
-    opportunities["potential_additional_revenue"] = f"${total_revenue_opportunity:,.2f}"
+    opportunities["potential_additional_revenue"] = _fmt_usd(total_revenue_opportunity)
     
     # Generate recommended actions
     opportunities["recommended_actions"] = [
@@ -364,7 +790,8 @@ def identify_enhancement_opportunities(
         },
         {
             "action": "Implement systematic rebalancing program",
-            "clients_affected": len([c for c in opportunities["priority_clients"] if any(o["type"] == "concentration_risk" for o in c["opportunities"])]),
+            # At most one concentration_risk opportunity is recorded per client
+            "clients_affected": len(opportunities["opportunities_by_category"]["risk_management"]),
             "timeline": "Next 60 days"
         },
         {
@@ -395,102 +822,19 @@ def analyze_client_help_desk_requests(
         tool_context: ADK tool context
         
     Returns:
-        Analysis of client help desk interactions and trends
+        Analysis of client help desk interactions and trends. The category
+        filter narrows request_categories only; request totals, resolution
+        metrics, trends and patterns always cover every category.
     """
-    crm_api = MockCRMAPI()
-    
     # Mock help desk data (in reality, would come from CRM/ticketing system)
-    help_desk_analysis = {
-        "analysis_period": time_period,
-        "analysis_date": datetime.utcnow().isoformat(),
-        "total_requests": 247,
-        "avg_requests_per_day": 2.7,
-        "resolution_metrics": {
-            "avg_resolution_time": "4.2 hours",
-            "first_contact_resolution": "68%",
-            "customer_satisfaction": "4.3/5.0"
-        },
-        "request_categories": {
-            "account_access": {"count": 89, "percentage": "36%", "avg_resolution": "2.1 hours"},
-            "investment_questions": {"count": 67, "percentage": "27%", "avg_resolution": "6.4 hours"},
-            "technical_issues": {"count": 45, "percentage": "18%", "avg_resolution": "3.8 hours"},
-            "fee_inquiries": {"count": 28, "percentage": "11%", "avg_resolution": "1.9 hours"},
-            "document_requests": {"count": 18, "percentage": "8%", "avg_resolution": "24.2 hours"}
-        },
-        "trending_issues": [
-            {
-                "issue": "Mobile app login difficulties",
-                "requests": 34,
-                "trend": "increasing",
-                "impact": "high",
-                "recommended_action": "Update mobile app authentication flow"
-            },
-            {
-                "issue": "Market volatility concerns",
-                "requests": 28,
-                "trend": "stable",
-                "impact": "medium",
-                "recommended_action": "Proactive market education campaign"
-            },
-            {
-                "issue": "ESG investment options requests",
-                "requests": 22,
-                "trend": "increasing",
-                "impact": "medium",
-                "recommended_action": "Expand ESG product offerings"
-            }
-        ],
-        "client_specific_patterns": [],
-        "proactive_recommendations": []
-    }
-    
-    # Client-specific patterns (mock data)
-    client_patterns = [
-        {
-            "pattern": "High-net-worth clients requesting alternative investments",
-            "affected_clients": 12,
-            "avg_requests_per_client": 3.2,
-            "recommendation": "Develop alternative investment educational materials"
-        },
-        {
-            "pattern": "Retirees asking about income generation strategies",
-            "affected_clients": 18,
-            "avg_requests_per_client": 2.8,
-            "recommendation": "Create retirement income planning workshops"
-        },
-        {
-            "pattern": "Younger clients inquiring about robo-advisor integration",
-            "affected_clients": 8,
-            "avg_requests_per_client": 4.1,
-            "recommendation": "Evaluate digital investment platform integration"
-        }
-    ]
-    
-    help_desk_analysis["client_specific_patterns"] = client_patterns
-    
-    # Proactive recommendations
-    help_desk_analysis["proactive_recommendations"] = [
-        {
-            "recommendation": "Implement chatbot for common account access issues",
-            "potential_impact": "Reduce 40% of account access requests",
-            "implementation_timeline": "2-3 months"
-        },
-        {
-            "recommendation": "Create video library for investment education",
-            "potential_impact": "Reduce investment question call volume by 25%",
-            "implementation_timeline": "1-2 months"
-        },
-        {
-            "recommendation": "Proactive client communication during market volatility",
-            "potential_impact": "Reduce anxiety-driven calls by 35%",
-            "implementation_timeline": "Immediate"
-        }
-    ]
+    help_desk_template = _HELP_DESK_CATEGORY_VIEWS.get(request_category, _HELP_DESK_TEMPLATE)
     
     return {
         "status": "SUCCESS",
         "message": f"Help desk analysis completed for {time_period} period",
-        **help_desk_analysis
+        "analysis_period": time_period,
+        "analysis_date": datetime.now().isoformat(),
+        **copy.deepcopy(dict(help_desk_template))
     }
 
 
@@ -510,17 +854,10 @@ def generate_client_outreach_recommendations(
     Returns:
         Personalized outreach recommendations for clients
     """
-    custodian_api = MockCustodianAPI()
-    crm_api = MockCRMAPI()
-    
-    client_accounts = [
-        "TEST001", "DEMO001", "CLIENT001", 
-        "WM100001", "WM100002", "WM100003", "WM100004", "WM100005",
-        "WM100006", "WM100007", "WM100008", "WM100009", "WM100010"
-    ]
+    client_accounts = _CLIENT_ACCOUNTS
     
     outreach_analysis = {
-        "analysis_date": datetime.utcnow().isoformat(),
+        "analysis_date": datetime.now().isoformat(),
         "outreach_type_filter": outreach_type,
         "priority_filter": priority_level,
         "total_outreach_recommendations": 0,
@@ -533,27 +870,29 @@ def generate_client_outreach_recommendations(
         }
     }
     
+    # Get client portfolios; failed accounts are absent from the maps
+    accounts_by_id, positions_by_id = _fetch_accounts(_CUSTODIAN, client_accounts)
+    
     for account_id in client_accounts:
-        # Get client portfolio and interaction history
-        account_response = custodian_api.get_account_info(account_id)
-        positions_response = custodian_api.get_positions(account_id)
+        account_info = accounts_by_id.get(account_id)
+        soa = positions_by_id.get(account_id)
         
-        if not (account_response.success and positions_response.success):
+        if account_info is None or soa is None:
             continue
         
-        positions = positions_response.data.get("positions", [])
-        portfolio_value = sum(pos.get("market_value", 0) for pos in positions)
+        portfolio_value_cents, portfolio_loss_cents = _portfolio_totals(soa)
+        portfolio_value = portfolio_value_cents / 100
+        portfolio_loss = portfolio_loss_cents / 100
         
         # Analyze client situation
         client_outreach = {
             "account_id": account_id,
-            "portfolio_value": f"${portfolio_value:,.2f}",
+            "portfolio_value": _fmt_usd(portfolio_value),
             "last_contact": "2024-01-15",  # Mock data
             "outreach_recommendations": []
         }
         
         # Market Impact Outreach
-        portfolio_loss = sum(pos.get("unrealized_gain_loss", 0) for pos in positions if pos.get("unrealized_gain_loss", 0) < 0)
         if portfolio_value > 0:
             loss_percentage = abs(portfolio_loss / portfolio_value) * 100
         else:
@@ -571,7 +910,7 @@ def generate_client_outreach_recommendations(
             outreach_analysis["scheduling_recommendations"]["immediate_calls"].append(account_id)
         
         # Opportunity-Based Outreach
-        cash_balance = account_response.data.get("cash_balance", 0)
+        cash_balance = account_info.get("cash_balance", 0)
         if cash_balance > portfolio_value * 0.15:  # High cash balance
             client_outreach["outreach_recommendations"].append({
                 "type": "investment_opportunity",
@@ -614,41 +953,7 @@ def generate_client_outreach_recommendations(
             outreach_analysis["client_outreach_plan"].append(client_outreach)
     
     # Generate communication templates
-    outreach_analysis["communication_templates"] = {
-        "market_volatility_comfort_call": {
-            "subject": "Portfolio Review - Navigating Market Volatility",
-            "opening": "I wanted to reach out personally regarding the recent market movements and their impact on your portfolio...",
-            "key_points": [
-                "Current market conditions context",
-                "Your portfolio's defensive positioning",
-                "Long-term investment perspective",
-                "Any questions or concerns you might have"
-            ],
-            "call_to_action": "Would you like to schedule a brief call this week to discuss?"
-        },
-        "investment_opportunity": {
-            "subject": "Investment Opportunities in Current Market Environment",
-            "opening": "Given the current market conditions, I've identified some strategic opportunities that align with your investment objectives...",
-            "key_points": [
-                "Cash deployment strategies",
-                "Attractive entry points in quality securities",
-                "Rebalancing opportunities",
-                "Tax-efficient investment approaches"
-            ],
-            "call_to_action": "Let's schedule a call to review these opportunities together"
-        },
-        "relationship_maintenance": {
-            "subject": "Quarterly Portfolio Review - Let's Connect",
-            "opening": "I hope you're doing well. It's been a while since we last spoke, and I'd love to catch up and review your portfolio performance...",
-            "key_points": [
-                "Portfolio performance update",
-                "Any changes in your financial situation",
-                "Upcoming financial planning opportunities",
-                "Market outlook and strategy adjustments"
-            ],
-            "call_to_action": "Would next week work for a portfolio review meeting?"
-        }
-    }
+    outreach_analysis["communication_templates"] = copy.deepcopy(dict(_OUTREACH_COMMUNICATION_TEMPLATES))
     
     outreach_analysis["total_outreach_recommendations"] = sum(
         len(client["outreach_recommendations"]) 
@@ -662,182 +967,121 @@ def generate_client_outreach_recommendations(
     }
 
 
-def suggest_personalized_materials(
-    client_id: Optional[str] = None,
-    content_type: str = "all",  # "educational", "market_updates", "planning_tools", "all"
-    tool_context: Optional[ToolContext] = None
-) -> dict:
+def _iter_content_suggestions(
+    client_accounts: Sequence[str],
+    custodian_api: Optional[MockCustodianAPI] = None
+) -> Iterator[Dict[str, Any]]:
     """
-    Suggest personalized materials and resources for clients based on their profile and current needs.
+    Yield personalized content suggestions one client at a time.
+    
+    Clients whose account data is unavailable, or who match no content
+    trigger, are skipped.
     
     Args:
-        client_id: Specific client ID (optional, will analyze all if not provided)
-        content_type: Type of content to suggest
-        tool_context: ADK tool context
+        client_accounts: Account IDs to generate suggestions for
+        custodian_api: Custodian API to fetch account data from
         
-    Returns:
-        Personalized content suggestions for clients
+    Yields:
+        Suggestion entry for each client with at least one recommendation
     """
-    custodian_api = MockCustodianAPI()
+    if custodian_api is None:
+        custodian_api = _CUSTODIAN
     
-    if client_id:
-        client_accounts = [client_id]
-    else:
-        client_accounts = [
-            "TEST001", "DEMO001", "CLIENT001", 
-            "WM100001", "WM100002", "WM100003", "WM100004", "WM100005"
-        ]
-    
-    content_suggestions = {
-        "analysis_date": datetime.utcnow().isoformat(),
-        "content_type_filter": content_type,
-        "client_content_recommendations": [],
-        "trending_content": [
-            {
-                "title": "Navigating Market Volatility: A Long-term Perspective",
-                "type": "market_commentary",
-                "relevance": "All clients experiencing portfolio declines",
-                "format": "PDF report + video explanation"
-            },
-            {
-                "title": "Tax Loss Harvesting Strategies for 2024",
-                "type": "tax_planning",
-                "relevance": "Clients with unrealized losses",
-                "format": "Interactive calculator + guide"
-            },
-            {
-                "title": "ESG Investing: Aligning Values with Returns",
-                "type": "investment_education",
-                "relevance": "Clients interested in sustainable investing",
-                "format": "Webinar series + fact sheets"
-            }
-        ],
-        "content_library": {
-            "educational_materials": [],
-            "planning_tools": [],
-            "market_insights": []
-        }
-    }
+    # Get client profiles in two batched requests rather than two per client
+    accounts_by_id, positions_by_id = _fetch_accounts(custodian_api, client_accounts)
     
     for account_id in client_accounts:
-        # Get client profile
-        account_response = custodian_api.get_account_info(account_id)
-        positions_response = custodian_api.get_positions(account_id)
+        account_info = accounts_by_id.get(account_id)
+        soa = positions_by_id.get(account_id)
         
-        if not (account_response.success and positions_response.success):
+        if account_info is None or soa is None:
             continue
         
-        account_info = account_response.data
-        positions = positions_response.data.get("positions", [])
-        portfolio_value = sum(pos.get("market_value", 0) for pos in positions)
+        portfolio_value_cents, portfolio_loss_cents = _portfolio_totals(soa)
+        portfolio_value = portfolio_value_cents / 100
+        portfolio_loss = portfolio_loss_cents / 100
+        
+        # Evaluate every content trigger first so clients with nothing to
+        # suggest skip building (and currency-formatting) a result entry
+        client_age = 45  # Mock age - would come from client profile
+        cash_balance = account_info.get("cash_balance", 0)
+        account_type = account_info.get("account_type", "INDIVIDUAL")
+        age_content = _AGE_CONTENT[bisect_right(_AGE_BREAKS, client_age)]
+        has_significant_losses = portfolio_loss < -_LOSS_THRESHOLD * portfolio_value
+        has_excess_cash = cash_balance > portfolio_value * _CASH_THRESHOLD
+        is_ira = account_type == "IRA"
+        is_high_net_worth = portfolio_value > _HNW_THRESHOLD
+        
+        if not (age_content is not None or has_significant_losses
+                or has_excess_cash or is_ira or is_high_net_worth):
+            continue
         
         client_suggestions = {
             "account_id": account_id,
-            "portfolio_value": f"${portfolio_value:,.2f}",
-            "account_type": account_info.get("account_type", "INDIVIDUAL"),
+            "portfolio_value": _fmt_usd(portfolio_value),
+            "account_type": account_type,
             "personalized_content": []
         }
+        add_content = client_suggestions["personalized_content"].append
         
-        # Age-based content (mock - would come from client profile)
-        client_age = 45  # Mock age
-        if client_age < 40:
-            client_suggestions["personalized_content"].append({
-                "category": "long_term_planning",
-                "title": "Building Wealth in Your 30s and 40s",
-                "description": "Strategies for accumulating wealth during peak earning years",
-                "format": "E-book + planning worksheets",
-                "priority": "medium"
-            })
-        elif client_age > 55:
-            client_suggestions["personalized_content"].append({
-                "category": "retirement_planning",
-                "title": "Pre-Retirement Checklist: 10 Years to Go",
-                "description": "Essential steps to prepare for retirement",
-                "format": "Checklist + retirement calculator",
-                "priority": "high"
-            })
+        # Age-based content
+        if age_content is not None:
+            add_content(dict(age_content))
         
         # Portfolio-based suggestions
-        portfolio_loss = sum(pos.get("unrealized_gain_loss", 0) for pos in positions if pos.get("unrealized_gain_loss", 0) < 0)
-        if abs(portfolio_loss) > portfolio_value * 0.05:  # Significant losses
-            client_suggestions["personalized_content"].append({
-                "category": "market_education",
-                "title": "Understanding Market Cycles and Your Portfolio",
-                "description": "Historical context and coping strategies for market downturns",
-                "format": "Video series + historical data charts",
-                "priority": "high"
-            })
+        if has_significant_losses:
+            add_content(dict(_CONTENT_MARKET_EDUCATION))
         
         # Cash balance suggestions
-        cash_balance = account_info.get("cash_balance", 0)
-        if cash_balance > portfolio_value * 0.1:
-            client_suggestions["personalized_content"].append({
-                "category": "investment_strategy",
-                "title": "Smart Cash Deployment Strategies",
-                "description": "Techniques for putting excess cash to work efficiently",
-                "format": "Interactive guide + opportunity scanner",
-                "priority": "medium"
-            })
+        if has_excess_cash:
+            add_content(dict(_CONTENT_CASH_DEPLOYMENT))
         
         # Account type specific content
-        if account_info.get("account_type") == "IRA":
-            client_suggestions["personalized_content"].append({
-                "category": "tax_planning",
-                "title": "IRA Optimization Strategies",
-                "description": "Maximizing tax advantages and planning distributions",
-                "format": "Tax calculator + strategy guide",
-                "priority": "medium"
-            })
+        if is_ira:
+            add_content(dict(_CONTENT_IRA))
         
         # High net worth content
-        if portfolio_value > 1000000:
-            client_suggestions["personalized_content"].append({
-                "category": "advanced_planning",
-                "title": "High Net Worth Planning Strategies",
-                "description": "Estate planning, tax optimization, and philanthropic giving",
-                "format": "Comprehensive planning guide + case studies",
-                "priority": "medium"
-            })
-            client_suggestions["personalized_content"].append({
-                "category": "alternative_investments",
-                "title": "Alternative Investment Opportunities",
-                "description": "Private equity, hedge funds, and real estate investments",
-                "format": "Market analysis + due diligence framework",
-                "priority": "low"
-            })
+        if is_high_net_worth:
+            add_content(dict(_CONTENT_HNW_PLANNING))
+            add_content(dict(_CONTENT_ALTERNATIVES))
         
-        if client_suggestions["personalized_content"]:
-            content_suggestions["client_content_recommendations"].append(client_suggestions)
-    
-    # Build content library structure
-    content_suggestions["content_library"] = {
-        "educational_materials": [
-            "Investment Basics Series",
-            "Risk Management Fundamentals", 
-            "Market Analysis Training",
-            "Financial Planning 101"
-        ],
-        "planning_tools": [
-            "Retirement Planning Calculator",
-            "Risk Assessment Questionnaire",
-            "Tax Loss Harvesting Optimizer",
-            "Asset Allocation Modeler"
-        ],
-        "market_insights": [
-            "Weekly Market Commentary",
-            "Quarterly Economic Outlook", 
-            "Sector Analysis Reports",
-            "Fed Policy Impact Analysis"
-        ]
-    }
+        yield client_suggestions
+
+
+def suggest_personalized_materials(
+    client_id: Optional[str] = None,
+    content_type: str = "all",  # "educational", "market_updates", "planning_tools", "all"
+    tool_context: Optional[ToolContext] = None
+) -> dict:
+    """
+    Suggest personalized materials and resources for clients based on their profile and current needs.
     
-    total_suggestions = sum(
-        len(client["personalized_content"]) 
-        for client in content_suggestions["client_content_recommendations"]
-    )
+    Args:
+        client_id: Specific client ID (optional, will analyze all if not provided)
+        content_type: Type of content to suggest
+        tool_context: ADK tool context
+        
+    Returns:
+        Personalized content suggestions for clients
+    """
+    if client_id:
+        client_accounts = (client_id,)
+    else:
+        client_accounts = _CONTENT_CLIENT_ACCOUNTS
+    
+    recommendations = []
+    add_recommendation = recommendations.append
+    total_suggestions = 0
+    for client_suggestions in _iter_content_suggestions(client_accounts):
+        add_recommendation(client_suggestions)
+        total_suggestions += len(client_suggestions["personalized_content"])
     
     return {
         "status": "SUCCESS",
         "message": f"Content suggestions generated: {total_suggestions} personalized recommendations for {len(client_accounts)} clients",
-        **content_suggestions
-    }
\ No newline at end of file
+        "analysis_date": datetime.now().isoformat(),
+        "content_type_filter": content_type,
+        "client_content_recommendations": recommendations,
+        "trending_content": [dict(content) for content in _TRENDING_CONTENT],
+        "content_library": dict(_CONTENT_LIBRARY)
+    }
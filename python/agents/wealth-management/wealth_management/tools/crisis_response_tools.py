@@ -1,12 +1,302 @@
 """Tools for Crisis Response Agent - Emergency management and client panic response"""
 
-import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from decimal import Decimal
+import asyncio
+import itertools
+from bisect import bisect_left
+from typing import Dict, Any, List, Mapping, Optional
+from datetime import datetime
+from types import MappingProxyType
+import numpy as np
 from google.adk.tools import ToolContext
-from ..mock_apis import MockCustodianAPI, MockCRMAPI
-from .memory_tools import get_current_account, remember_account, store_conversation_context
+from ..mock_apis import MockCustodianAPI
+from ..shared_libraries.cache_utils import API_CACHE_TTL_SECONDS, TTLCache
+from .memory_tools import get_current_account, store_conversation_context
+
+
+# Sequence for _new_id, so records created within the same second stay unique
+_id_sequence = itertools.count(1)
+
+# Bound once and shared by the tools below for dollar amounts and percentages
+_fmt_usd = "${:,.2f}".format
+_fmt_pct = "{:.1f}%".format
+_fmt_securities_lending = "Securities-based lending: ${:,.2f} available".format
+
+# Shared custodian client; its reads are safe to issue from worker threads
+_CUSTODIAN = MockCustodianAPI()
+
+# Positions data per account, so repeated scenario analyses during one crisis
+# conversation skip the custodian round trip
+_POSITIONS_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS)
+
+# Emergency protocol definitions by crisis type; _EMERGENCY_PROTOCOLS is
+# derived from these once at import
+_PROTOCOL_DEFINITIONS = {
+    "panic_selling": {
+        "response_time": "IMMEDIATE",
+        "required_actions": (
+            "Contact client immediately to discuss concerns",
+            "Provide behavioral coaching and market context", 
+            "Prepare scenario analysis of liquidation impact",
+            "Document emotional state and concerns",
+            "Schedule follow-up meeting within 24 hours"
+        ),
+        "escalation_triggers": ("Threatens to leave firm", "Extreme distress", "Large liquidation request"),
+        "team_involvement": ("Primary Advisor", "Senior Advisor", "Operations")
+    },
+    "market_crash": {
+        "response_time": "2_HOURS",
+        "required_actions": (
+            "Assess portfolio impact and protection strategies",
+            "Prepare market context and historical perspective",
+            "Review cash flow needs and liquidity",
+            "Proactive client communication",
+            "Coordinate with investment committee"
+        ),
+        "escalation_triggers": ("Portfolio loss >20%", "Client media interviews", "Regulatory inquiry"),
+        "team_involvement": ("All Advisors", "Investment Committee", "Compliance")
+    },
+    "family_death": {
+        "response_time": "4_HOURS",
+        "required_actions": (
+            "Express condolences and provide support",
+            "Coordinate with estate planning team",
+            "Freeze joint accounts if necessary",
+            "Assist with estate settlement process", 
+            "Connect family with appropriate specialists"
+        ),
+        "escalation_triggers": ("Estate disputes", "Beneficiary conflicts", "Large estate value"),
+        "team_involvement": ("Primary Advisor", "Estate Planning", "Operations", "Legal")
+    },
+    "health_crisis": {
+        "response_time": "SAME_DAY",
+        "required_actions": (
+            "Provide emotional and financial support",
+            "Review healthcare financing options",
+            "Coordinate with disability insurance providers",
+            "Update medical directives and powers of attorney",
+            "Plan for potential long-term care needs"
+        ),
+        "escalation_triggers": ("Terminal diagnosis", "Family financial hardship", "Insurance disputes"),
+        "team_involvement": ("Primary Advisor", "Insurance Specialist", "Estate Planning")
+    },
+    "natural_disaster": {
+        "response_time": "IMMEDIATE",
+        "required_actions": (
+            "Verify client and family safety",
+            "Expedite emergency fund access",
+            "Coordinate with insurance companies",
+            "Provide temporary financial assistance",
+            "Plan financial recovery strategy"
+        ),
+        "escalation_triggers": ("Total property loss", "Family displacement", "Business destruction"),
+        "team_involvement": ("Primary Advisor", "Operations", "Insurance Specialist", "Emergency Response")
+    }
+}
+
+# Emergency protocols by crisis type, with the response fields that depend
+# only on the protocol derived here rather than on every activation
+_EMERGENCY_PROTOCOLS = MappingProxyType({
+    crisis_type: MappingProxyType({
+        **protocol,
+        "immediate_next_steps": protocol["required_actions"][:3],
+        "coordination_required": "Notify: " + ", ".join(protocol["team_involvement"])
+    })
+    for crisis_type, protocol in _PROTOCOL_DEFINITIONS.items()
+})
+_DEFAULT_PROTOCOL = _EMERGENCY_PROTOCOLS["panic_selling"]
+
+# Coaching strategies by emotional state
+_COACHING_STRATEGIES = MappingProxyType({
+    "panic": MappingProxyType({
+        "primary_objective": "Immediate calming and perspective",
+        "approach": "ACKNOWLEDGE_AND_REDIRECT",
+        "key_phrases": (
+            "I understand this feels overwhelming right now",
+            "Let's take a step back and look at your full financial picture",
+            "Your feelings are completely normal and understandable"
+        ),
+        "techniques": (
+            "Active listening and validation",
+            "Focus on long-term goals and progress",
+            "Provide concrete data and historical context",
+            "Break down complex decisions into smaller steps"
+        ),
+        "avoid": ("Minimizing their concerns", "Making immediate major changes", "Providing market predictions")
+    }),
+    "fear": MappingProxyType({
+        "primary_objective": "Build confidence through information",
+        "approach": "EDUCATE_AND_REASSURE",
+        "key_phrases": (
+            "Let me show you how your portfolio is designed to handle this",
+            "We've prepared for situations exactly like this",
+            "Your diversification is working as intended"
+        ),
+        "techniques": (
+            "Review portfolio design rationale",
+            "Show historical market recovery patterns",
+            "Explain defensive positioning benefits",
+            "Reinforce advisor availability and support"
+        ),
+        "avoid": ("Rushing decisions", "Comparing to other clients", "Providing false guarantees")
+    }),
+    "anxiety": MappingProxyType({
+        "primary_objective": "Reduce uncertainty through planning",
+        "approach": "STRUCTURE_AND_CONTROL",
+        "key_phrases": (
+            "Let's create a clear plan for moving forward",
+            "Here are the specific steps we can take",
+            "You have more control over this situation than you think"
+        ),
+        "techniques": (
+            "Create specific action plans",
+            "Schedule regular check-ins",
+            "Provide written summaries of discussions",
+            "Focus on controllable factors"
+        ),
+        "avoid": ("Open-ended timelines", "Vague reassurances", "Too many options at once")
+    }),
+    "anger": MappingProxyType({
+        "primary_objective": "Channel energy constructively",
+        "approach": "VALIDATE_AND_REDIRECT",
+        "key_phrases": (
+            "I can hear how frustrated you are about this situation",
+            "Let's focus that energy on protecting and growing your wealth",
+            "Your concerns are valid, now let's address them systematically"
+        ),
+        "techniques": (
+            "Acknowledge their right to be upset",
+            "Focus on problem-solving activities",
+            "Provide factual analysis without defensiveness",
+            "Channel anger into positive action"
+        ),
+        "avoid": ("Becoming defensive", "Arguing with their perspective", "Making excuses")
+    }),
+    "despair": MappingProxyType({
+        "primary_objective": "Restore hope and perspective",
+        "approach": "SUPPORT_AND_REBUILD",
+        "key_phrases": (
+            "I know this feels devastating, but we can work through this together",
+            "You've overcome challenges before, and you have the strength to do it again",
+            "Let's focus on what we can rebuild and improve"
+        ),
+        "techniques": (
+            "Provide unconditional support and availability",
+            "Focus on small, achievable wins",
+            "Connect with other support resources if needed",
+            "Emphasize their past resilience and strength"
+        ),
+        "avoid": ("Rushing recovery timeline", "Providing unsolicited advice", "Comparing their situation")
+    })
+})
+_DEFAULT_COACHING_STRATEGY = _COACHING_STRATEGIES["anxiety"]
+
+# Market context framing by market condition
+_MARKET_CONTEXT = MappingProxyType({
+    "volatile": "short-term market movement that's part of normal cycles",
+    "declining": "market downturn that creates long-term opportunities",
+    "crashing": "severe market stress that tests portfolio resilience"
+})
+_DEFAULT_MARKET_CONTEXT = _MARKET_CONTEXT["volatile"]
+
+# Market impact scenarios
+_IMPACT_MULTIPLIERS = MappingProxyType({
+    "mild": MappingProxyType({"stocks": -0.05, "bonds": -0.01, "recovery_months": 6}),
+    "moderate": MappingProxyType({"stocks": -0.15, "bonds": -0.03, "recovery_months": 18}), 
+    "severe": MappingProxyType({"stocks": -0.30, "bonds": -0.08, "recovery_months": 36})
+})
+_DEFAULT_IMPACT = _IMPACT_MULTIPLIERS["moderate"]
+
+# Withdrawal recommendation tiers by percentage of portfolio withdrawn. A
+# percentage equal to a threshold stays in the lower tier (bisect_left).
+_WITHDRAWAL_THRESHOLDS = (10, 25, 50)
+_WITHDRAWAL_TIERS = (
+    ("MANAGEABLE - Monitor impact on long-term goals", "LOW"),
+    ("PROCEED_WITH_CARE - Consider timing and tax implications", "MODERATE"),
+    ("CAUTION_ADVISED - Explore partial withdrawal or alternatives", "HIGH"),
+    ("STRONGLY_DISCOURAGE - Consider alternative funding sources", "VERY_HIGH")
+)
+
+# Asset class index per symbol for stress tests; unlisted symbols are stocks
+_STOCK, _BOND, _CASH = 0, 1, 2
+_ASSET_CLASS_INDEX = MappingProxyType({
+    "BND": _BOND, "TLT": _BOND, "AGG": _BOND, "VGIT": _BOND,
+    "CASH": _CASH
+})
+
+# Meeting parameters by urgency
+_MEETING_PARAMETERS = MappingProxyType({
+    "routine": MappingProxyType({
+        "timeline": "WITHIN_1_WEEK",
+        "duration": "60_MINUTES",
+        "format": "IN_PERSON_OR_VIDEO",
+        "preparation_time": "2_DAYS"
+    }),
+    "urgent": MappingProxyType({
+        "timeline": "WITHIN_24_HOURS", 
+        "duration": "45_MINUTES",
+        "format": "VIDEO_OR_PHONE",
+        "preparation_time": "4_HOURS"
+    }),
+    "critical": MappingProxyType({
+        "timeline": "WITHIN_4_HOURS",
+        "duration": "30_MINUTES", 
+        "format": "PHONE_CALL",
+        "preparation_time": "1_HOUR"
+    }),
+    "emergency": MappingProxyType({
+        "timeline": "IMMEDIATE",
+        "duration": "AS_NEEDED",
+        "format": "PHONE_CALL",
+        "preparation_time": "MINIMAL"
+    })
+})
+_DEFAULT_MEETING_PARAMETERS = _MEETING_PARAMETERS["urgent"]
+
+# Coordination actions for each known meeting stakeholder
+_STAKEHOLDER_ACTIONS = MappingProxyType({
+    "client": (
+        "Contact via primary phone number",
+        "Confirm emotional readiness for discussion",
+        "Provide brief agenda overview",
+        "Ensure private/comfortable setting"
+    ),
+    "primary_advisor": (
+        "Review recent client interactions",
+        "Prepare relevant portfolio/market data",
+        "Plan discussion approach and objectives",
+        "Coordinate with support team if needed"
+    ),
+    "senior_advisor": (
+        "Brief on client situation and history",
+        "Review escalation triggers and options",
+        "Prepare advanced solutions and alternatives",
+        "Plan post-meeting follow-up strategy"
+    )
+})
+
+# Keywords (lowercase) that trigger extra follow-up when documenting a crisis
+_PANIC_KEYWORDS = ("panic",)
+_LIQUIDATION_KEYWORDS = ("liquidation", "withdrawal")
+
+# Follow-up requirements added for each documentation trigger
+_PANIC_FOLLOW_UPS = (
+    "Schedule 48-hour check-in call",
+    "Monitor account for unusual activity",
+    "Document emotional state progression",
+    "Consider behavioral coaching referral"
+)
+_LIQUIDATION_FOLLOW_UPS = (
+    "Process withdrawal documentation",
+    "Calculate tax implications",
+    "Update financial plan projections",
+    "Review portfolio rebalancing needs"
+)
+_CRITICAL_FOLLOW_UPS = (
+    "Senior management notification required",
+    "Compliance review of actions taken",
+    "Client satisfaction survey",
+    "Process improvement review"
+)
 
 
 def initiate_emergency_protocol(crisis_type: str, client_id: Optional[str] = None, urgency_level: str = "high", tool_context: ToolContext = None) -> dict:
@@ -33,79 +323,16 @@ def initiate_emergency_protocol(crisis_type: str, client_id: Optional[str] = Non
                 "message": "No client specified for emergency protocol. Please provide client ID."
             }
     
-    # Define emergency protocols by crisis type
-    emergency_protocols = {
-        "panic_selling": {
-            "response_time": "IMMEDIATE",
-            "required_actions": [
-                "Contact client immediately to discuss concerns",
-                "Provide behavioral coaching and market context", 
-                "Prepare scenario analysis of liquidation impact",
-                "Document emotional state and concerns",
-                "Schedule follow-up meeting within 24 hours"
-            ],
-            "escalation_triggers": ["Threatens to leave firm", "Extreme distress", "Large liquidation request"],
-            "team_involvement": ["Primary Advisor", "Senior Advisor", "Operations"]
-        },
-        "market_crash": {
-            "response_time": "2_HOURS",
-            "required_actions": [
-                "Assess portfolio impact and protection strategies",
-                "Prepare market context and historical perspective",
-                "Review cash flow needs and liquidity",
-                "Proactive client communication",
-                "Coordinate with investment committee"
-            ],
-            "escalation_triggers": ["Portfolio loss >20%", "Client media interviews", "Regulatory inquiry"],
-            "team_involvement": ["All Advisors", "Investment Committee", "Compliance"]
-        },
-        "family_death": {
-            "response_time": "4_HOURS",
-            "required_actions": [
-                "Express condolences and provide support",
-                "Coordinate with estate planning team",
-                "Freeze joint accounts if necessary",
-                "Assist with estate settlement process", 
-                "Connect family with appropriate specialists"
-            ],
-            "escalation_triggers": ["Estate disputes", "Beneficiary conflicts", "Large estate value"],
-            "team_involvement": ["Primary Advisor", "Estate Planning", "Operations", "Legal"]
-        },
-        "health_crisis": {
-            "response_time": "SAME_DAY",
-            "required_actions": [
-                "Provide emotional and financial support",
-                "Review healthcare financing options",
-                "Coordinate with disability insurance providers",
-                "Update medical directives and powers of attorney",
-                "Plan for potential long-term care needs"
-            ],
-            "escalation_triggers": ["Terminal diagnosis", "Family financial hardship", "Insurance disputes"],
-            "team_involvement": ["Primary Advisor", "Insurance Specialist", "Estate Planning"]
-        },
-        "natural_disaster": {
-            "response_time": "IMMEDIATE",
-            "required_actions": [
-                "Verify client and family safety",
-                "Expedite emergency fund access",
-                "Coordinate with insurance companies",
-                "Provide temporary financial assistance",
-                "Plan financial recovery strategy"
-            ],
-            "escalation_triggers": ["Total property loss", "Family displacement", "Business destruction"],
-            "team_involvement": ["Primary Advisor", "Operations", "Insurance Specialist", "Emergency Response"]
-        }
-    }
+    protocol = _EMERGENCY_PROTOCOLS.get(crisis_type, _DEFAULT_PROTOCOL)
     
-    protocol = emergency_protocols.get(crisis_type, emergency_protocols["panic_selling"])
-    
-    # Generate emergency response plan
+    # Generate emergency response plan; the ID and timestamp share one clock read
+    now = datetime.now()
     emergency_response = {
-        "protocol_id": f"EMRG-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+        "protocol_id": _new_id("EMRG", now),
         "crisis_type": crisis_type,
         "client_id": client_id,
         "urgency_level": urgency_level,
-        "initiated_timestamp": datetime.now().isoformat(),
+        "initiated_timestamp": now.isoformat(),
         "response_time_requirement": protocol["response_time"],
         "required_actions": protocol["required_actions"],
         "team_involvement": protocol["team_involvement"],
@@ -115,10 +342,10 @@ def initiate_emergency_protocol(crisis_type: str, client_id: Optional[str] = Non
     
     # Store emergency context
     if tool_context:
-        if "active_emergencies" not in tool_context.state:
-            tool_context.state["active_emergencies"] = {}
-        
-        tool_context.state["active_emergencies"][emergency_response["protocol_id"]] = emergency_response
+        # Assign a copy back so the new entry lands in the session state delta
+        active_emergencies = dict(tool_context.state.get("active_emergencies", {}))
+        active_emergencies[emergency_response["protocol_id"]] = emergency_response
+        tool_context.state["active_emergencies"] = active_emergencies
         
         # Store conversation context
         store_conversation_context("emergency_response", {
@@ -131,8 +358,8 @@ def initiate_emergency_protocol(crisis_type: str, client_id: Optional[str] = Non
         "status": "SUCCESS",
         "message": f"Emergency protocol initiated for {crisis_type}",
         "emergency_response": emergency_response,
-        "immediate_next_steps": protocol["required_actions"][:3],
-        "coordination_required": f"Notify: {', '.join(protocol['team_involvement'])}"
+        "immediate_next_steps": protocol["immediate_next_steps"],
+        "coordination_required": protocol["coordination_required"]
     }
 
 
@@ -148,101 +375,11 @@ def provide_behavioral_coaching(client_emotion: str, market_condition: str, tool
     Returns:
         Dictionary with behavioral coaching strategy and talking points
     """
-    # Define coaching strategies by emotional state
-    coaching_strategies = {
-        "panic": {
-            "primary_objective": "Immediate calming and perspective",
-            "approach": "ACKNOWLEDGE_AND_REDIRECT",
-            "key_phrases": [
-                "I understand this feels overwhelming right now",
-                "Let's take a step back and look at your full financial picture",
-                "Your feelings are completely normal and understandable"
-            ],
-            "techniques": [
-                "Active listening and validation",
-                "Focus on long-term goals and progress",
-                "Provide concrete data and historical context",
-                "Break down complex decisions into smaller steps"
-            ],
-            "avoid": ["Minimizing their concerns", "Making immediate major changes", "Providing market predictions"]
-        },
-        "fear": {
-            "primary_objective": "Build confidence through information",
-            "approach": "EDUCATE_AND_REASSURE",
-            "key_phrases": [
-                "Let me show you how your portfolio is designed to handle this",
-                "We've prepared for situations exactly like this",
-                "Your diversification is working as intended"
-            ],
-            "techniques": [
-                "Review portfolio design rationale",
-                "Show historical market recovery patterns",
-                "Explain defensive positioning benefits",
-                "Reinforce advisor availability and support"
-            ],
-            "avoid": ["Rushing decisions", "Comparing to other clients", "Providing false guarantees"]
-        },
-        "anxiety": {
-            "primary_objective": "Reduce uncertainty through planning",
-            "approach": "STRUCTURE_AND_CONTROL",
-            "key_phrases": [
-                "Let's create a clear plan for moving forward",
-                "Here are the specific steps we can take",
-                "You have more control over this situation than you think"
-            ],
-            "techniques": [
-                "Create specific action plans",
-                "Schedule regular check-ins",
-                "Provide written summaries of discussions",
-                "Focus on controllable factors"
-            ],
-            "avoid": ["Open-ended timelines", "Vague reassurances", "Too many options at once"]
-        },
-        "anger": {
-            "primary_objective": "Channel energy constructively",
-            "approach": "VALIDATE_AND_REDIRECT",
-            "key_phrases": [
-                "I can hear how frustrated you are about this situation",
-                "Let's focus that energy on protecting and growing your wealth",
-                "Your concerns are valid, now let's address them systematically"
-            ],
-            "techniques": [
-                "Acknowledge their right to be upset",
-                "Focus on problem-solving activities",
-                "Provide factual analysis without defensiveness",
-                "Channel anger into positive action"
-            ],
-            "avoid": ["Becoming defensive", "Arguing with their perspective", "Making excuses"]
-        },
-        "despair": {
-            "primary_objective": "Restore hope and perspective",
-            "approach": "SUPPORT_AND_REBUILD",
-            "key_phrases": [
-                "I know this feels devastating, but we can work through this together",
-                "You've overcome challenges before, and you have the strength to do it again",
-                "Let's focus on what we can rebuild and improve"
-            ],
-            "techniques": [
-                "Provide unconditional support and availability",
-                "Focus on small, achievable wins",
-                "Connect with other support resources if needed",
-                "Emphasize their past resilience and strength"
-            ],
-            "avoid": ["Rushing recovery timeline", "Providing unsolicited advice", "Comparing their situation"]
-        }
-    }
-    
     # Get coaching strategy
-    strategy = coaching_strategies.get(client_emotion, coaching_strategies["anxiety"])
+    strategy = _COACHING_STRATEGIES.get(client_emotion, _DEFAULT_COACHING_STRATEGY)
     
     # Customize based on market condition
-    market_context = {
-        "volatile": "short-term market movement that's part of normal cycles",
-        "declining": "market downturn that creates long-term opportunities",
-        "crashing": "severe market stress that tests portfolio resilience"
-    }
-    
-    context = market_context.get(market_condition, market_context["volatile"])
+    context = _MARKET_CONTEXT.get(market_condition, _DEFAULT_MARKET_CONTEXT)
     
     # Generate coaching session plan
     coaching_plan = {
@@ -291,7 +428,28 @@ def provide_behavioral_coaching(client_emotion: str, market_condition: str, tool
     }
 
 
-def prepare_scenario_analysis(withdrawal_amount: float, market_impact: str, client_account: Optional[str] = None, tool_context: ToolContext = None) -> dict:
+def _new_id(prefix: str, now: datetime) -> str:
+    """Record ID from now as a compact timestamp plus a process-wide sequence number"""
+    return f"{prefix}-{now:%Y%m%d%H%M%S}-{next(_id_sequence)}"
+
+
+def _stressed_portfolio_value(positions: List[Dict[str, Any]], impact_data: Mapping[str, Any]) -> float:
+    """Portfolio value after applying a market impact scenario's per-asset-class shocks"""
+    if not positions:
+        return 0.0
+    
+    count = len(positions)
+    market_values = np.fromiter((pos.get("market_value", 0) for pos in positions), dtype=np.float64, count=count)
+    asset_classes = np.fromiter(
+        (_ASSET_CLASS_INDEX.get(pos.get("symbol"), _STOCK) for pos in positions), dtype=np.int8, count=count
+    )
+    
+    # One shock per asset class, gathered per position and applied in a single pass
+    shocks = np.array([impact_data["stocks"], impact_data["bonds"], 0.0])
+    return float(market_values @ (1.0 + shocks[asset_classes]))
+
+
+async def prepare_scenario_analysis(withdrawal_amount: float, market_impact: str, client_account: Optional[str] = None, tool_context: ToolContext = None) -> dict:
     """
     Prepare scenario analysis for major portfolio changes during crisis.
     
@@ -315,32 +473,34 @@ def prepare_scenario_analysis(withdrawal_amount: float, market_impact: str, clie
                 "message": "No client account specified for scenario analysis"
             }
     
-    custodian_api = MockCustodianAPI()
-    
-    # Get current portfolio data
-    portfolio_response = custodian_api.get_positions(client_account)
-    if not portfolio_response.success:
-        return {
-            "status": "ERROR",
-            "message": f"Failed to retrieve portfolio data: {portfolio_response.error}"
-        }
+    # Get current portfolio data, reusing a recent fetch for the same account
+    portfolio_data = _POSITIONS_CACHE.get(client_account)
+    if portfolio_data is None:
+        # The custodian call blocks, so run it off the event loop
+        portfolio_response = await asyncio.to_thread(_CUSTODIAN.get_positions, client_account)
+        if not portfolio_response.success:
+            return {
+                "status": "ERROR",
+                "message": f"Failed to retrieve portfolio data: {portfolio_response.error}"
+            }
+        
+        portfolio_data = portfolio_response.data
+        _POSITIONS_CACHE.set(client_account, portfolio_data)
     
-    portfolio_data = portfolio_response.data
     positions = portfolio_data.get("positions", [])
     total_portfolio_value = portfolio_data.get("total_market_value", 0)
     
-    # Define market impact scenarios
-    impact_multipliers = {
-        "mild": {"stocks": -0.05, "bonds": -0.01, "recovery_months": 6},
-        "moderate": {"stocks": -0.15, "bonds": -0.03, "recovery_months": 18}, 
-        "severe": {"stocks": -0.30, "bonds": -0.08, "recovery_months": 36}
-    }
-    
-    impact_data = impact_multipliers.get(market_impact, impact_multipliers["moderate"])
+    impact_data = _IMPACT_MULTIPLIERS.get(market_impact, _DEFAULT_IMPACT)
+    stressed_portfolio_value = _stressed_portfolio_value(positions, impact_data)
     
     # Calculate current scenario (immediate withdrawal)
     withdrawal_percentage = (withdrawal_amount / total_portfolio_value * 100) if total_portfolio_value > 0 else 0
     remaining_portfolio_value = total_portfolio_value - withdrawal_amount
+    estimated_tax = withdrawal_amount * 0.15  # Estimated 15% tax
+    partial_amount = withdrawal_amount * 0.5
+    remaining_after_partial = total_portfolio_value - partial_amount
+    projected_recovery_value = remaining_after_partial * 1.1
+    securities_lending_available = withdrawal_amount * 0.7
     
     # Calculate projected scenarios
     scenarios = []
@@ -348,10 +508,10 @@ def prepare_scenario_analysis(withdrawal_amount: float, market_impact: str, clie
     # Scenario 1: Immediate withdrawal at current market
     current_scenario = {
         "scenario_name": "Immediate Withdrawal (Current Market)",
-        "withdrawal_amount": f"${withdrawal_amount:,.2f}",
-        "withdrawal_percentage": f"{withdrawal_percentage:.1f}%",
-        "remaining_portfolio": f"${remaining_portfolio_value:,.2f}",
-        "tax_implications": f"${withdrawal_amount * 0.15:,.2f}",  # Estimated 15% tax
+        "withdrawal_amount": _fmt_usd(withdrawal_amount),
+        "withdrawal_percentage": _fmt_pct(withdrawal_percentage),
+        "remaining_portfolio": _fmt_usd(remaining_portfolio_value),
+        "tax_implications": _fmt_usd(estimated_tax),
         "opportunity_cost": "Immediate liquidity, no market timing risk",
         "pros": ["Immediate access to funds", "No further market risk on withdrawn amount"],
         "cons": ["May be selling at unfavorable prices", "Reduces long-term wealth building"]
@@ -359,13 +519,12 @@ def prepare_scenario_analysis(withdrawal_amount: float, market_impact: str, clie
     scenarios.append(current_scenario)
     
     # Scenario 2: Partial withdrawal with market recovery wait
-    partial_amount = withdrawal_amount * 0.5
     partial_scenario = {
         "scenario_name": "Partial Withdrawal + Wait Strategy",
-        "withdrawal_amount": f"${partial_amount:,.2f}",
-        "withdrawal_percentage": f"{partial_amount / total_portfolio_value * 100:.1f}%",
-        "remaining_portfolio": f"${total_portfolio_value - partial_amount:,.2f}",
-        "projected_recovery_value": f"${(total_portfolio_value - partial_amount) * 1.1:,.2f}",
+        "withdrawal_amount": _fmt_usd(partial_amount),
+        "withdrawal_percentage": _fmt_pct(partial_amount / total_portfolio_value * 100),
+        "remaining_portfolio": _fmt_usd(remaining_after_partial),
+        "projected_recovery_value": _fmt_usd(projected_recovery_value),
         "recovery_timeline": f"{impact_data['recovery_months']} months",
         "pros": ["Reduced immediate market impact", "Preserves growth potential", "Staged approach"],
         "cons": ["May not meet immediate cash needs", "Still subject to market risk"]
@@ -376,9 +535,9 @@ def prepare_scenario_analysis(withdrawal_amount: float, market_impact: str, clie
     alternative_scenario = {
         "scenario_name": "Alternative Funding Sources",
         "options": [
-            f"Securities-based lending: ${withdrawal_amount * 0.7:,.2f} available",
-            f"Home equity line: Potential access to additional funds",
-            f"Cash flow optimization: Review expense reduction opportunities"
+            _fmt_securities_lending(securities_lending_available),
+            "Home equity line: Potential access to additional funds",
+            "Cash flow optimization: Review expense reduction opportunities"
         ],
         "benefits": ["Preserves investment positions", "May offer tax advantages", "Maintains long-term strategy"],
         "considerations": ["Interest costs", "Qualification requirements", "Ongoing payments"]
@@ -386,26 +545,16 @@ def prepare_scenario_analysis(withdrawal_amount: float, market_impact: str, clie
     scenarios.append(alternative_scenario)
     
     # Generate recommendations
-    if withdrawal_percentage > 50:
-        recommendation = "STRONGLY_DISCOURAGE - Consider alternative funding sources"
-        risk_level = "VERY_HIGH"
-    elif withdrawal_percentage > 25:
-        recommendation = "CAUTION_ADVISED - Explore partial withdrawal or alternatives"
-        risk_level = "HIGH"
-    elif withdrawal_percentage > 10:
-        recommendation = "PROCEED_WITH_CARE - Consider timing and tax implications"
-        risk_level = "MODERATE"
-    else:
-        recommendation = "MANAGEABLE - Monitor impact on long-term goals"
-        risk_level = "LOW"
+    recommendation, risk_level = _WITHDRAWAL_TIERS[bisect_left(_WITHDRAWAL_THRESHOLDS, withdrawal_percentage)]
     
     return {
         "status": "SUCCESS",
         "analysis_timestamp": datetime.now().isoformat(),
         "client_account": client_account,
-        "current_portfolio_value": f"${total_portfolio_value:,.2f}",
-        "requested_withdrawal": f"${withdrawal_amount:,.2f}",
+        "current_portfolio_value": _fmt_usd(total_portfolio_value),
+        "requested_withdrawal": _fmt_usd(withdrawal_amount),
         "market_impact_assumption": market_impact,
+        "stressed_portfolio_value": _fmt_usd(stressed_portfolio_value),
         "scenarios": scenarios,
         "recommendation": recommendation,
         "risk_level": risk_level,
@@ -431,114 +580,99 @@ def coordinate_emergency_meeting(urgency_level: str, stakeholders: Optional[List
     Returns:
         Dictionary with meeting coordination details
     """
-    if stakeholders is None:
-        stakeholders = ["primary_advisor", "client"]
-    
-    # Define meeting parameters by urgency
-    meeting_parameters = {
-        "routine": {
-            "timeline": "WITHIN_1_WEEK",
-            "duration": "60_MINUTES",
-            "format": "IN_PERSON_OR_VIDEO",
-            "preparation_time": "2_DAYS"
-        },
-        "urgent": {
-            "timeline": "WITHIN_24_HOURS", 
-            "duration": "45_MINUTES",
-            "format": "VIDEO_OR_PHONE",
-            "preparation_time": "4_HOURS"
-        },
-        "critical": {
-            "timeline": "WITHIN_4_HOURS",
-            "duration": "30_MINUTES", 
-            "format": "PHONE_CALL",
-            "preparation_time": "1_HOUR"
-        },
-        "emergency": {
-            "timeline": "IMMEDIATE",
-            "duration": "AS_NEEDED",
-            "format": "PHONE_CALL",
-            "preparation_time": "MINIMAL"
-        }
-    }
-    
-    params = meeting_parameters.get(urgency_level, meeting_parameters["urgent"])
-    
-    # Generate meeting coordination plan
-    meeting_id = f"MTG-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    return coordinate_emergency_meetings(
+        [{"urgency_level": urgency_level, "stakeholders": stakeholders}], tool_context
+    )[0]
+
+
+def coordinate_emergency_meetings(meeting_requests: List[Dict[str, Any]], tool_context: ToolContext = None) -> List[dict]:
+    """
+    Coordinate several emergency meetings in one call.
     
-    coordination_plan = {
-        "meeting_id": meeting_id,
-        "urgency_level": urgency_level,
-        "timeline_requirement": params["timeline"],
-        "estimated_duration": params["duration"],
-        "recommended_format": params["format"],
-        "preparation_time_available": params["preparation_time"],
-        "required_stakeholders": stakeholders,
-        "coordination_tasks": [
-            "Contact all stakeholders immediately",
-            "Identify optimal meeting time within timeline",
-            "Set up meeting technology/logistics",
-            "Prepare relevant documents and materials",
-            "Send meeting invitations with agenda"
-        ]
-    }
+    The timestamp and the scheduled-meetings state update are shared by
+    every meeting in the batch.
     
-    # Add stakeholder-specific coordination
-    stakeholder_actions = {}
-    for stakeholder in stakeholders:
-        if stakeholder == "client":
-            stakeholder_actions["client"] = [
-                "Contact via primary phone number",
-                "Confirm emotional readiness for discussion",
-                "Provide brief agenda overview",
-                "Ensure private/comfortable setting"
-            ]
-        elif stakeholder == "primary_advisor":
-            stakeholder_actions["primary_advisor"] = [
-                "Review recent client interactions",
-                "Prepare relevant portfolio/market data",
-                "Plan discussion approach and objectives",
-                "Coordinate with support team if needed"
-            ]
-        elif stakeholder == "senior_advisor":
-            stakeholder_actions["senior_advisor"] = [
-                "Brief on client situation and history",
-                "Review escalation triggers and options",
-                "Prepare advanced solutions and alternatives",
-                "Plan post-meeting follow-up strategy"
+    Args:
+        meeting_requests: Meetings to coordinate, each with an "urgency_level"
+            and optional "stakeholders" list
+        tool_context: ADK tool context for state management
+        
+    Returns:
+        List of meeting coordination results, in request order
+    """
+    now = datetime.now()
+    scheduled_timestamp = now.isoformat()
+    
+    results = []
+    scheduled_meetings = {}
+    for meeting_request in meeting_requests:
+        urgency_level = meeting_request.get("urgency_level", "urgent")
+        stakeholders = meeting_request.get("stakeholders")
+        if stakeholders is None:
+            stakeholders = ["primary_advisor", "client"]
+        
+        params = _MEETING_PARAMETERS.get(urgency_level, _DEFAULT_MEETING_PARAMETERS)
+        
+        meeting_id = _new_id("MTG", now)
+        
+        # Generate meeting coordination plan
+        coordination_plan = {
+            "meeting_id": meeting_id,
+            "urgency_level": urgency_level,
+            "timeline_requirement": params["timeline"],
+            "estimated_duration": params["duration"],
+            "recommended_format": params["format"],
+            "preparation_time_available": params["preparation_time"],
+            "required_stakeholders": stakeholders,
+            "coordination_tasks": [
+                "Contact all stakeholders immediately",
+                "Identify optimal meeting time within timeline",
+                "Set up meeting technology/logistics",
+                "Prepare relevant documents and materials",
+                "Send meeting invitations with agenda"
             ]
-    
-    coordination_plan["stakeholder_specific_actions"] = stakeholder_actions
-    
-    # Store meeting coordination in context
-    if tool_context:
-        if "scheduled_meetings" not in tool_context.state:
-            tool_context.state["scheduled_meetings"] = {}
+        }
         
-        tool_context.state["scheduled_meetings"][meeting_id] = {
+        # Add stakeholder-specific coordination
+        coordination_plan["stakeholder_specific_actions"] = {
+            stakeholder: _STAKEHOLDER_ACTIONS[stakeholder]
+            for stakeholder in stakeholders
+            if stakeholder in _STAKEHOLDER_ACTIONS
+        }
+        
+        scheduled_meetings[meeting_id] = {
             "urgency": urgency_level,
             "stakeholders": stakeholders,
-            "scheduled_timestamp": datetime.now().isoformat(),
+            "scheduled_timestamp": scheduled_timestamp,
             "status": "COORDINATING"
         }
+        
+        results.append({
+            "status": "SUCCESS",
+            "meeting_coordination": coordination_plan,
+            "immediate_actions": [
+                f"Contact stakeholders within timeline: {params['timeline']}",
+                f"Set up {params['format']} meeting capability",
+                f"Prepare materials with {params['preparation_time']} available"
+            ],
+            "success_criteria": [
+                "All stakeholders contacted and available",
+                "Meeting scheduled within timeline requirement",
+                "Appropriate preparation completed",
+                "Clear agenda and objectives established"
+            ],
+            "message": f"Emergency meeting coordination initiated for {urgency_level} situation with {len(stakeholders)} stakeholders"
+        })
+    
+    # Store all meeting coordination in context with one assignment, so the
+    # batch lands in the session state delta
+    if tool_context and scheduled_meetings:
+        tool_context.state["scheduled_meetings"] = {
+            **tool_context.state.get("scheduled_meetings", {}),
+            **scheduled_meetings
+        }
     
-    return {
-        "status": "SUCCESS",
-        "meeting_coordination": coordination_plan,
-        "immediate_actions": [
-            f"Contact stakeholders within timeline: {params['timeline']}",
-            f"Set up {params['format']} meeting capability",
-            f"Prepare materials with {params['preparation_time']} available"
-        ],
-        "success_criteria": [
-            "All stakeholders contacted and available",
-            "Meeting scheduled within timeline requirement",
-            "Appropriate preparation completed",
-            "Clear agenda and objectives established"
-        ],
-        "message": f"Emergency meeting coordination initiated for {urgency_level} situation with {len(stakeholders)} stakeholders"
-    }
+    return results
 
 
 def document_crisis_interaction(incident_details: Dict[str, Any], resolution: str, tool_context: ToolContext = None) -> dict:
@@ -553,12 +687,13 @@ def document_crisis_interaction(incident_details: Dict[str, Any], resolution: st
     Returns:
         Dictionary with documentation details and follow-up requirements
     """
-    # Generate documentation record
-    documentation_id = f"DOC-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    # Generate documentation record; the ID and timestamp share one clock read
+    now = datetime.now()
+    documentation_id = _new_id("DOC", now)
     
     crisis_documentation = {
         "documentation_id": documentation_id,
-        "incident_timestamp": datetime.now().isoformat(),
+        "incident_timestamp": now.isoformat(),
         "incident_type": incident_details.get("crisis_type", "UNSPECIFIED"),
         "client_id": incident_details.get("client_id", "UNKNOWN"),
         "urgency_level": incident_details.get("urgency_level", "MODERATE"),
@@ -574,37 +709,23 @@ def document_crisis_interaction(incident_details: Dict[str, Any], resolution: st
     
     # Determine follow-up requirements
     follow_up_requirements = []
+    crisis_type = incident_details.get("crisis_type", "").lower()
+    resolution_text = resolution.lower()
+    
+    if any(keyword in crisis_type for keyword in _PANIC_KEYWORDS):
+        follow_up_requirements.extend(_PANIC_FOLLOW_UPS)
     
-    if "panic" in incident_details.get("crisis_type", "").lower():
-        follow_up_requirements.extend([
-            "Schedule 48-hour check-in call",
-            "Monitor account for unusual activity", 
-            "Document emotional state progression",
-            "Consider behavioral coaching referral"
-        ])
-    
-    if "liquidation" in resolution.lower() or "withdrawal" in resolution.lower():
-        follow_up_requirements.extend([
-            "Process withdrawal documentation",
-            "Calculate tax implications",
-            "Update financial plan projections",
-            "Review portfolio rebalancing needs"
-        ])
+    if any(keyword in resolution_text for keyword in _LIQUIDATION_KEYWORDS):
+        follow_up_requirements.extend(_LIQUIDATION_FOLLOW_UPS)
     
     if incident_details.get("urgency_level") in ["critical", "emergency"]:
-        follow_up_requirements.extend([
-            "Senior management notification required",
-            "Compliance review of actions taken",
-            "Client satisfaction survey",
-            "Process improvement review"
-        ])
+        follow_up_requirements.extend(_CRITICAL_FOLLOW_UPS)
     
     # Store documentation in context
     if tool_context:
-        if "crisis_documentation" not in tool_context.state:
-            tool_context.state["crisis_documentation"] = {}
-        
-        tool_context.state["crisis_documentation"][documentation_id] = crisis_documentation
+        documentation = dict(tool_context.state.get("crisis_documentation", {}))
+        documentation[documentation_id] = crisis_documentation
+        tool_context.state["crisis_documentation"] = documentation
     
     return {
         "status": "SUCCESS",
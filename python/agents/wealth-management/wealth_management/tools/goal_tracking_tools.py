@@ -1,11 +1,207 @@
 """Tools for investment goal tracker agent with context management"""
 
-import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import math
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
 from google.adk.tools import ToolContext
-from ..shared_libraries import FinancialCalculator
-from .memory_tools import get_current_account, remember_account
+from .memory_tools import get_current_account
+
+# Mock goal data - in real implementation would come from database
+_MOCK_GOAL_DATA = {
+    "retirement_401k": {
+        "name": "Retirement Savings",
+        "target_amount": 1000000,
+        "target_date": "2040-01-01",
+        "current_amount": 275000,
+        "monthly_contribution": 1500,
+        "expected_return": 0.07
+    },
+    "GOAL001": {
+        "name": "Emergency Fund",
+        "target_amount": 50000,
+        "target_date": "2025-12-31", 
+        "current_amount": 35000,
+        "monthly_contribution": 1000,
+        "expected_return": 0.03
+    },
+    "house_down_payment": {
+        "name": "House Down Payment",
+        "target_amount": 100000,
+        "target_date": "2027-06-01",
+        "current_amount": 45000,
+        "monthly_contribution": 2000,
+        "expected_return": 0.05
+    }
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Goal:
+    """Investment goal record"""
+    name: str
+    target_amount: float
+    target_date: str
+    target_ordinal: int  # target_date as a date ordinal, for day arithmetic
+    current_amount: float
+    monthly_contribution: float
+    expected_return: float
+
+
+# Read-only goal records with target dates parsed once at import, as date
+# ordinals so days remaining is a single integer subtraction
+_MOCK_GOALS = MappingProxyType({
+    goal_id: Goal(**goal, target_ordinal=date.fromisoformat(goal["target_date"]).toordinal())
+    for goal_id, goal in _MOCK_GOAL_DATA.items()
+})
+_DEFAULT_GOAL = _MOCK_GOALS["GOAL001"]
+
+# Goal parameters as aligned columns, so every goal is scored in one array pass
+_GOAL_IDS = tuple(_MOCK_GOALS)
+_GOAL_TARGETS = np.array([goal.target_amount for goal in _MOCK_GOALS.values()], dtype=float)
+_GOAL_CURRENTS = np.array([goal.current_amount for goal in _MOCK_GOALS.values()], dtype=float)
+_GOAL_CONTRIBUTIONS = np.array([goal.monthly_contribution for goal in _MOCK_GOALS.values()], dtype=float)
+_GOAL_MONTHLY_RATES = np.array([goal.expected_return for goal in _MOCK_GOALS.values()]) / 12
+_GOAL_TARGET_ORDINALS = np.array([goal.target_ordinal for goal in _MOCK_GOALS.values()])
+
+# Fixed suggestions shared by every goal; copied into plain dicts per call
+# because tool results must stay serializable
+_BEHIND_SUGGESTIONS = (
+    MappingProxyType({
+        "type": "EXTEND_TIMELINE",
+        "description": "Consider extending target date by 6-12 months",
+        "impact": "Reduces required monthly contribution",
+        "difficulty": "LOW"
+    }),
+    MappingProxyType({
+        "type": "REDUCE_TARGET",
+        "description": "Consider reducing target amount by 10-20%",
+        "impact": "Makes goal more achievable",
+        "difficulty": "LOW"
+    })
+)
+_ON_TRACK_SUGGESTIONS = (
+    MappingProxyType({
+        "type": "ACCELERATE_GOAL",
+        "description": "Goal is on track - consider increasing contributions to finish early",
+        "impact": "Achieve goal ahead of schedule",
+        "difficulty": "LOW"
+    }),
+    MappingProxyType({
+        "type": "ADD_STRETCH_GOAL",
+        "description": "Add a stretch target of 10% above current goal",
+        "impact": "Build additional financial cushion",
+        "difficulty": "MEDIUM"
+    })
+)
+
+# Average days per month, and its reciprocal so day counts convert by multiplying
+_DAYS_PER_MONTH = 30.44
+_INV_DAYS_PER_MONTH = 1 / _DAYS_PER_MONTH
+
+# Timeline milestones as (label, fraction of target), fixed for every goal
+_MILESTONES = (("25%", 0.25), ("50%", 0.5), ("75%", 0.75), ("100%", 1.0))
+
+# Bound format methods skip f-string parsing for whole-value fields
+_fmt_usd = "${:,.2f}".format
+_fmt_pct = "{:.1f}%".format
+
+# Annual return scenarios shown alongside every savings calculation (3%, 5%, 7%, 10%)
+_SCENARIO_RATES = np.array([0.03, 0.05, 0.07, 0.10])
+_SCENARIO_MONTHLY_RATES = _SCENARIO_RATES / 12
+_SCENARIO_LABELS = tuple(_fmt_pct(rate * 100) for rate in _SCENARIO_RATES.tolist())
+
+
+def _level_payment(amount, monthly_rate, months):
+    """Level monthly payment (PMT) that grows to amount at a nonzero rate; scalars or arrays"""
+    return amount * monthly_rate / ((1 + monthly_rate) ** months - 1)
+
+
+def _account_from_context(tool_context: ToolContext, purpose: str) -> Tuple[Optional[str], Optional[dict]]:
+    """Look up the remembered account; returns (account_id, error payload)"""
+    account_context = get_current_account(tool_context)
+    if account_context["status"] == "SUCCESS":
+        return account_context["account_id"], None
+    return None, {
+        "status": "ERROR",
+        "message": f"No account specified for {purpose}. Please provide an account ID.",
+        "available_accounts": account_context.get("available_accounts", [])
+    }
+
+
+@lru_cache(maxsize=512)
+def _progress_figures(goal_id: str, today_ordinal: int) -> Tuple[float, float, float, bool]:
+    """Raw progress numbers for a goal as of the given day (date ordinal)"""
+    # Use goal_id or fallback to first goal for demo
+    goal = _MOCK_GOALS.get(goal_id, _DEFAULT_GOAL)
+    
+    # Calculate progress metrics
+    remaining_amount = goal.target_amount - goal.current_amount
+    
+    # Calculate time metrics
+    months_remaining = max(1, (goal.target_ordinal - today_ordinal) * _INV_DAYS_PER_MONTH)
+    
+    # Calculate if on track: level monthly payment (PMT) over the whole months left
+    monthly_rate = goal.expected_return / 12
+    months = int(months_remaining)
+    if remaining_amount <= 0:
+        monthly_needed = 0.0
+    elif monthly_rate == 0:
+        monthly_needed = remaining_amount / months
+    else:
+        monthly_needed = _level_payment(remaining_amount, monthly_rate, months)
+    
+    on_track = goal.monthly_contribution >= monthly_needed * 0.95  # 5% tolerance
+    
+    return remaining_amount, months_remaining, monthly_needed, on_track
+
+
+def _progress_payload(goal_id: str, goal: Goal, remaining_amount: float, months_remaining: float,
+                      monthly_needed: float, on_track: bool) -> Dict[str, Any]:
+    """Format one goal's progress figures for the tool response"""
+    progress_percentage = (goal.current_amount / goal.target_amount) * 100
+    
+    return {
+        "status": "SUCCESS",
+        "goal_id": goal_id,
+        "goal_name": goal.name,
+        "target_amount": _fmt_usd(goal.target_amount),
+        "current_amount": _fmt_usd(goal.current_amount),
+        "progress_percentage": _fmt_pct(progress_percentage),
+        "remaining_amount": _fmt_usd(remaining_amount),
+        "target_date": goal.target_date,
+        "months_remaining": f"{months_remaining:.1f}",
+        "monthly_contribution": _fmt_usd(goal.monthly_contribution),
+        "monthly_needed": f"${monthly_needed:.2f}",
+        "on_track": str(on_track),
+        "message": f"Goal progress: {progress_percentage:.1f}% complete"
+    }
+
+
+@lru_cache(maxsize=8)
+def _all_progress_figures(today_ordinal: int) -> Tuple[Tuple[float, float, float, bool], ...]:
+    """Raw progress numbers for every goal in one vectorized pass, in _GOAL_IDS order"""
+    remaining_amount = _GOAL_TARGETS - _GOAL_CURRENTS
+    months_remaining = np.maximum(1, (_GOAL_TARGET_ORDINALS - today_ordinal) * _INV_DAYS_PER_MONTH)
+    
+    # Same level-payment formula as _progress_figures, over whole months
+    months = np.floor(months_remaining)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        monthly_needed = np.where(
+            _GOAL_MONTHLY_RATES == 0,
+            remaining_amount / months,
+            _level_payment(remaining_amount, _GOAL_MONTHLY_RATES, months)
+        )
+    monthly_needed = np.where(remaining_amount <= 0, 0.0, monthly_needed)
+    
+    on_track = _GOAL_CONTRIBUTIONS >= monthly_needed * 0.95  # 5% tolerance
+    
+    return tuple(zip(
+        remaining_amount.tolist(), months_remaining.tolist(), monthly_needed.tolist(), on_track.tolist()
+    ))
 
 
 def track_goal_progress(goal_id: str, account_id: Optional[str] = None, tool_context: ToolContext = None) -> dict:
@@ -23,77 +219,47 @@ def track_goal_progress(goal_id: str, account_id: Optional[str] = None, tool_con
     """
     # Use context-aware account resolution
     if not account_id and tool_context:
-        account_context = get_current_account(tool_context)
-        if account_context["status"] == "SUCCESS":
-            account_id = account_context["account_id"]
-        else:
-            return {
-                "status": "ERROR",
-                "message": f"No account specified for goal {goal_id} tracking. Please provide an account ID.",
-                "available_accounts": account_context.get("available_accounts", [])
-            }
-    # Mock goal data - in real implementation would come from database
-    mock_goals = {
-        "retirement_401k": {
-            "name": "Retirement Savings",
-            "target_amount": 1000000,
-            "target_date": "2040-01-01",
-            "current_amount": 275000,
-            "monthly_contribution": 1500,
-            "expected_return": 0.07
-        },
-        "GOAL001": {
-            "name": "Emergency Fund",
-            "target_amount": 50000,
-            "target_date": "2025-12-31", 
-            "current_amount": 35000,
-            "monthly_contribution": 1000,
-            "expected_return": 0.03
-        },
-        "house_down_payment": {
-            "name": "House Down Payment",
-            "target_amount": 100000,
-            "target_date": "2027-06-01",
-            "current_amount": 45000,
-            "monthly_contribution": 2000,
-            "expected_return": 0.05
-        }
-    }
+        account_id, error = _account_from_context(tool_context, f"goal {goal_id} tracking")
+        if error:
+            return error
     
-    # Use goal_id or fallback to first goal for demo
-    goal = mock_goals.get(goal_id, mock_goals.get("GOAL001", list(mock_goals.values())[0]))
-    
-    # Calculate progress metrics
-    progress_percentage = (goal["current_amount"] / goal["target_amount"]) * 100
-    remaining_amount = goal["target_amount"] - goal["current_amount"]
-    
-    # Calculate time metrics
-    target_date = datetime.strptime(goal["target_date"], "%Y-%m-%d")
-    current_date = datetime.now()
-    months_remaining = max(1, (target_date - current_date).days / 30.44)
+    # The raw figures only change from one day to the next and are cached per day
+    goal = _MOCK_GOALS.get(goal_id, _DEFAULT_GOAL)
+    return _progress_payload(goal_id, goal, *_progress_figures(goal_id, date.today().toordinal()))
+
+
+def track_all_goals(account_id: Optional[str] = None, tool_context: ToolContext = None) -> dict:
+    """
+    Track progress toward all of a client's investment goals in one call.
+    Automatically uses remembered account if no account_id provided.
     
-    # Calculate if on track
-    calculator = FinancialCalculator()
-    monthly_needed = calculator.calculate_required_savings(
-        remaining_amount, goal["expected_return"] / 12, int(months_remaining)
-    )
+    Args:
+        account_id: Optional account identifier (uses remembered account if not provided)
+        tool_context: ADK tool context for state management
+        
+    Returns:
+        Dictionary with progress information for every goal
+    """
+    # Use context-aware account resolution
+    if not account_id and tool_context:
+        account_id, error = _account_from_context(tool_context, "goal tracking")
+        if error:
+            return error
     
-    on_track = goal["monthly_contribution"] >= monthly_needed * 0.95  # 5% tolerance
+    all_figures = _all_progress_figures(date.today().toordinal())
+    goals = [
+        _progress_payload(goal_id, _MOCK_GOALS[goal_id], *figures)
+        for goal_id, figures in zip(_GOAL_IDS, all_figures)
+    ]
+    goals_on_track = sum(on_track for *_, on_track in all_figures)
     
     return {
         "status": "SUCCESS",
-        "goal_id": goal_id,
-        "goal_name": goal["name"],
-        "target_amount": f"${goal['target_amount']:,.2f}",
-        "current_amount": f"${goal['current_amount']:,.2f}",
-        "progress_percentage": f"{progress_percentage:.1f}%",
-        "remaining_amount": f"${remaining_amount:,.2f}",
-        "target_date": goal["target_date"],
-        "months_remaining": f"{months_remaining:.1f}",
-        "monthly_contribution": f"${goal['monthly_contribution']:,.2f}",
-        "monthly_needed": f"${monthly_needed:.2f}",
-        "on_track": str(on_track),
-        "message": f"Goal progress: {progress_percentage:.1f}% complete"
+        "account_id": account_id,
+        "num_goals": len(goals),
+        "goals_on_track": goals_on_track,
+        "goals": goals,
+        "message": f"{goals_on_track} of {len(goals)} goals on track"
     }
 
 
@@ -113,9 +279,6 @@ def project_goal_timeline(client_id: str, goal_data: Dict[str, Any]) -> dict:
     monthly_contribution = goal_data.get("monthly_contribution", 1000)
     expected_return = goal_data.get("expected_return", 0.07)
     
-    # Calculate timeline using financial calculator
-    calculator = FinancialCalculator()
-    
     # Calculate months needed to reach goal
     if monthly_contribution <= 0:
         return {
@@ -126,41 +289,37 @@ def project_goal_timeline(client_id: str, goal_data: Dict[str, Any]) -> dict:
     remaining_amount = target_amount - current_amount
     monthly_rate = expected_return / 12
     
-    # Simplified calculation for demo
-    if monthly_rate > 0:
-        months_needed = calculator.calculate_time_to_goal(
-            remaining_amount, monthly_contribution, monthly_rate
-        )
+    # Closed-form annuity inversion: n = ln(1 + r * FV / PMT) / ln(1 + r)
+    if remaining_amount <= 0:
+        months_needed = 0.0
+    elif monthly_rate > 0:
+        months_needed = math.log1p(monthly_rate * remaining_amount / monthly_contribution) / math.log1p(monthly_rate)
     else:
         months_needed = remaining_amount / monthly_contribution
     
     # Create milestone projections
-    milestones = []
-    milestone_percentages = [25, 50, 75, 100]
-    
-    for pct in milestone_percentages:
-        milestone_amount = target_amount * (pct / 100)
-        milestone_months = months_needed * (pct / 100)
-        milestone_date = datetime.now() + timedelta(days=milestone_months * 30.44)
-        
-        milestones.append({
-            "percentage": f"{pct}%",
-            "amount": f"${milestone_amount:,.2f}",
-            "projected_date": milestone_date.strftime("%Y-%m-%d"),
-            "months_from_now": f"{milestone_months:.1f}"
-        })
+    today_ordinal = date.today().toordinal()
+    milestones = [
+        {
+            "percentage": label,
+            "amount": _fmt_usd(target_amount * fraction),
+            "projected_date": date.fromordinal(today_ordinal + int(months_needed * fraction * _DAYS_PER_MONTH)).isoformat(),
+            "months_from_now": f"{months_needed * fraction:.1f}"
+        }
+        for label, fraction in _MILESTONES
+    ]
     
-    completion_date = datetime.now() + timedelta(days=months_needed * 30.44)
+    completion_date = date.fromordinal(today_ordinal + int(months_needed * _DAYS_PER_MONTH))
     
     return {
         "status": "SUCCESS",
         "client_id": client_id,
-        "target_amount": f"${target_amount:,.2f}",
-        "current_amount": f"${current_amount:,.2f}",
-        "monthly_contribution": f"${monthly_contribution:,.2f}",
-        "expected_return": f"{expected_return * 100:.1f}%",
+        "target_amount": _fmt_usd(target_amount),
+        "current_amount": _fmt_usd(current_amount),
+        "monthly_contribution": _fmt_usd(monthly_contribution),
+        "expected_return": _fmt_pct(expected_return * 100),
         "months_needed": f"{months_needed:.1f}",
-        "completion_date": completion_date.strftime("%Y-%m-%d"),
+        "completion_date": completion_date.isoformat(),
         "milestones": milestones,
         "message": f"Goal projected to be achieved in {months_needed:.1f} months"
     }
@@ -181,69 +340,27 @@ def suggest_goal_adjustments(goal_id: str, client_id: Optional[str] = None, tool
     """
     # Use context-aware account resolution
     if not client_id and tool_context:
-        account_context = get_current_account(tool_context)
-        if account_context["status"] == "SUCCESS":
-            client_id = account_context["account_id"]
-        else:
-            return {
-                "status": "ERROR",
-                "message": f"No account specified for goal {goal_id} adjustment suggestions. Please provide an account ID.",
-                "available_accounts": account_context.get("available_accounts", [])
-            }
-    # Get current goal progress first
-    progress_data = track_goal_progress(client_id, goal_id)
-    
-    if progress_data["status"] != "SUCCESS":
-        return {
-            "status": "ERROR",
-            "message": "Unable to retrieve goal progress for analysis"
-        }
-    
-    # Parse current values
-    on_track = progress_data["on_track"] == "True"
-    current_contribution = float(progress_data["monthly_contribution"].replace("$", "").replace(",", ""))
-    needed_contribution = float(progress_data["monthly_needed"].replace("$", "").replace(",", ""))
-    
-    suggestions = []
+        client_id, error = _account_from_context(tool_context, f"goal {goal_id} adjustment suggestions")
+        if error:
+            return error
+    # Read the raw progress numbers rather than parsing formatted currency strings
+    goal = _MOCK_GOALS.get(goal_id, _DEFAULT_GOAL)
+    _, _, needed_contribution, on_track = _progress_figures(goal_id, date.today().toordinal())
+    current_contribution = goal.monthly_contribution
     
-    if not on_track:
-        contribution_gap = needed_contribution - current_contribution
-        
-        suggestions.extend([
+    # Only the contribution increase depends on this goal's numbers
+    if on_track:
+        suggestions = [dict(suggestion) for suggestion in _ON_TRACK_SUGGESTIONS]
+    else:
+        suggestions = [
             {
                 "type": "INCREASE_CONTRIBUTION",
-                "description": f"Increase monthly contribution by ${contribution_gap:.2f}",
+                "description": f"Increase monthly contribution by ${needed_contribution - current_contribution:.2f}",
                 "impact": "Ensures goal stays on track",
                 "difficulty": "MEDIUM"
             },
-            {
-                "type": "EXTEND_TIMELINE", 
-                "description": "Consider extending target date by 6-12 months",
-                "impact": "Reduces required monthly contribution",
-                "difficulty": "LOW"
-            },
-            {
-                "type": "REDUCE_TARGET",
-                "description": "Consider reducing target amount by 10-20%",
-                "impact": "Makes goal more achievable",
-                "difficulty": "LOW"
-            }
-        ])
-    else:
-        suggestions.extend([
-            {
-                "type": "ACCELERATE_GOAL",
-                "description": "Goal is on track - consider increasing contributions to finish early",
-                "impact": "Achieve goal ahead of schedule",
-                "difficulty": "LOW"
-            },
-            {
-                "type": "ADD_STRETCH_GOAL",
-                "description": "Add a stretch target of 10% above current goal",
-                "impact": "Build additional financial cushion", 
-                "difficulty": "MEDIUM"
-            }
-        ])
+            *(dict(suggestion) for suggestion in _BEHIND_SUGGESTIONS)
+        ]
     
     return {
         "status": "SUCCESS",
@@ -272,15 +389,9 @@ def calculate_required_savings(goal_amount: float, years: int, client_id: Option
     """
     # Use context-aware account resolution
     if not client_id and tool_context:
-        account_context = get_current_account(tool_context)
-        if account_context["status"] == "SUCCESS":
-            client_id = account_context["account_id"]
-        else:
-            return {
-                "status": "ERROR",
-                "message": f"No account specified for savings calculation. Please provide an account ID.",
-                "available_accounts": account_context.get("available_accounts", [])
-            }
+        client_id, error = _account_from_context(tool_context, "savings calculation")
+        if error:
+            return error
     if goal_amount <= 0 or years <= 0:
         return {
             "status": "VALIDATION_ERROR",
@@ -295,46 +406,41 @@ def calculate_required_savings(goal_amount: float, years: int, client_id: Option
     else:
         expected_return = 0.03  # Conservative/short-term
     
-    calculator = FinancialCalculator()
-    
     # Calculate required monthly savings with compound interest
     monthly_rate = expected_return / 12
     months = years * 12
     
     if monthly_rate > 0:
         # PMT calculation for annuity
-        monthly_payment = goal_amount * monthly_rate / ((1 + monthly_rate) ** months - 1)
+        monthly_payment = _level_payment(goal_amount, monthly_rate, months)
     else:
         # Simple division if no interest
         monthly_payment = goal_amount / months
     
-    # Calculate different scenarios
-    scenarios = []
-    return_rates = [0.03, 0.05, 0.07, 0.10]  # 3%, 5%, 7%, 10%
-    
-    for rate in return_rates:
-        monthly_rate_scenario = rate / 12
-        if monthly_rate_scenario > 0:
-            payment = goal_amount * monthly_rate_scenario / ((1 + monthly_rate_scenario) ** months - 1)
-        else:
-            payment = goal_amount / months
-            
-        scenarios.append({
-            "return_rate": f"{rate * 100:.1f}%",
+    # Calculate different scenarios in one pass over the rate table
+    payments = _level_payment(goal_amount, _SCENARIO_MONTHLY_RATES, months)
+    contributions = payments * months
+    scenarios = [
+        {
+            "return_rate": label,
             "monthly_savings": f"${payment:.2f}",
-            "total_contributions": f"${payment * months:,.2f}",
-            "growth": f"${goal_amount - (payment * months):,.2f}"
-        })
+            "total_contributions": _fmt_usd(contribution),
+            "growth": _fmt_usd(growth)
+        }
+        for label, payment, contribution, growth in zip(
+            _SCENARIO_LABELS, payments.tolist(), contributions.tolist(), (goal_amount - contributions).tolist()
+        )
+    ]
     
     return {
         "status": "SUCCESS",
         "client_id": client_id,
-        "goal_amount": f"${goal_amount:,.2f}",
+        "goal_amount": _fmt_usd(goal_amount),
         "time_horizon": f"{years} years ({months} months)",
         "recommended_monthly_savings": f"${monthly_payment:.2f}",
-        "expected_return": f"{expected_return * 100:.1f}%",
-        "total_contributions": f"${monthly_payment * months:,.2f}",
-        "projected_growth": f"${goal_amount - (monthly_payment * months):,.2f}",
+        "expected_return": _fmt_pct(expected_return * 100),
+        "total_contributions": _fmt_usd(monthly_payment * months),
+        "projected_growth": _fmt_usd(goal_amount - (monthly_payment * months)),
         "scenarios": scenarios,
         "message": f"Monthly savings of ${monthly_payment:.2f} required to reach ${goal_amount:,.2f} goal"
     }
\ No newline at end of file
@@ -1,88 +1,320 @@
 """Tools for Market Intelligence Agent - Market volatility and economic event response"""
 
-import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from decimal import Decimal
+from typing import Any, List, Optional
+from datetime import datetime
+from types import MappingProxyType
 from google.adk.tools import ToolContext
 from ..mock_apis import MockMarketDataAPI, MockCustodianAPI
-from .memory_tools import get_current_account, remember_account
+from ..shared_libraries.cache_utils import API_CACHE_TTL_SECONDS, TTLCache
+from .memory_tools import get_current_account
 
+# Shared API clients, created once instead of on every tool call
+_MARKET_DATA = MockMarketDataAPI()
+_CUSTODIAN = MockCustodianAPI()
 
-def analyze_market_volatility(threshold: float = 5.0, timeframe: str = "1D", tool_context: ToolContext = None) -> dict:
+# Recent API reads, so the volatility and impact tools chained within one
+# agent turn share a fetch instead of repeating it
+_MARKET_INDICES_KEY = "indices"
+_MARKET_INDICES_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS, maxsize=1)
+_POSITIONS_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS)
+
+# Bound once for the per-position figures in assess_portfolio_impact
+_fmt_usd = "${:,.2f}".format
+_fmt_signed_usd = "${:+,.2f}".format
+_fmt_signed_pct = "{:+.1f}%".format
+
+# Market commentary by event type and client segment
+_COMMENTARY_TEMPLATES = MappingProxyType({
+    "volatility": MappingProxyType({
+        "conservative": MappingProxyType({
+            "headline": "Market Volatility Update - Your Portfolio Remains Stable",
+            "message": "While today's market movements may seem concerning, your conservative portfolio allocation is designed to weather these periods of volatility. Your bond and cash positions provide stability during uncertain times.",
+            "action_items": ("Review your emergency fund adequacy", "Consider this an opportunity to discuss rebalancing", "Maintain long-term perspective")
+        }),
+        "moderate": MappingProxyType({
+            "headline": "Market Volatility - Staying the Course",
+            "message": "Today's market volatility is a reminder of why we maintain a balanced approach to your investments. Your diversified portfolio is positioned to capture long-term growth while managing downside risk.",
+            "action_items": ("Review portfolio allocation", "Consider tax-loss harvesting opportunities", "Maintain disciplined investment approach")
+        }),
+        "aggressive": MappingProxyType({
+            "headline": "Market Volatility Creates Opportunities",
+            "message": "While market volatility can be unsettling, history shows these periods often present long-term investment opportunities. Your growth-focused strategy is built to capitalize on market cycles.",
+            "action_items": ("Consider additional investment opportunities", "Review risk tolerance", "Focus on long-term wealth building goals")
+        })
+    }),
+    "correction": MappingProxyType({
+        "conservative": MappingProxyType({
+            "headline": "Market Correction - Your Conservative Strategy Provides Protection",
+            "message": "Market corrections are normal parts of market cycles. Your conservative allocation significantly limits your exposure to this downturn while preserving capital for future opportunities.",
+            "action_items": ("Review cash flow needs", "Consider defensive positioning", "Prepare for potential rebalancing")
+        }),
+        "moderate": MappingProxyType({
+            "headline": "Navigating the Market Correction",
+            "message": "Market corrections, while uncomfortable, are normal and expected events. Your balanced portfolio is designed to participate in recoveries while limiting downside exposure during corrections like this one.",
+            "action_items": ("Stay disciplined with investment plan", "Consider rebalancing opportunities", "Review and reaffirm long-term goals")
+        }),
+        "aggressive": MappingProxyType({
+            "headline": "Market Correction Presents Long-Term Opportunities",
+            "message": "Market corrections often create excellent long-term investment opportunities. While short-term volatility is challenging, your growth strategy positions you to benefit from eventual market recovery.",
+            "action_items": ("Consider increasing equity positions", "Review dollar-cost averaging opportunities", "Maintain focus on long-term wealth creation")
+        })
+    })
+})
+
+_DEFAULT_COMMENTARY_SEGMENTS = ("conservative", "moderate", "aggressive")
+
+# Estimated price impact by event type and position type
+_IMPACT_FACTORS = MappingProxyType({
+    "volatility": MappingProxyType({"stocks": -0.02, "bonds": -0.005, "cash": 0.0}),  # 2% stocks, 0.5% bonds
+    "correction": MappingProxyType({"stocks": -0.12, "bonds": -0.02, "cash": 0.0}),   # 12% stocks, 2% bonds
+    "crash": MappingProxyType({"stocks": -0.25, "bonds": -0.05, "cash": 0.0})        # 25% stocks, 5% bonds
+})
+
+# Position type by symbol (simplified); anything not listed is treated as stocks
+_POSITION_TYPES = MappingProxyType({
+    "BND": "bonds",
+    "VGIT": "bonds",
+    "TLT": "bonds",
+    "CASH": "cash",
+    "VMOT": "cash"
+})
+
+# Comfort call scripts by market condition and risk tolerance
+_CALL_SCRIPTS = MappingProxyType({
+    "volatile": MappingProxyType({
+        "conservative": MappingProxyType({
+            "opening": "I'm calling to check in with you regarding today's market activity. I know you prefer a conservative approach, and I want to reassure you about your portfolio positioning.",
+            "key_points": (
+                "Your portfolio is heavily weighted toward stable investments",
+                "Bond and cash positions are providing stability during this volatility",
+                "This type of market movement is normal and expected",
+                "Your conservative allocation is protecting your capital"
+            ),
+            "behavioral_coaching": "Acknowledge their concerns and emphasize the protective nature of their conservative strategy.",
+            "closing": "Remember, we built your portfolio specifically to weather periods like this. I'm here if you have any concerns."
+        }),
+        "moderate": MappingProxyType({
+            "opening": "I wanted to reach out regarding today's market movements and discuss how your balanced portfolio is positioned during this volatility.",
+            "key_points": (
+                "Your diversified approach is working as designed",
+                "Both growth and defensive positions are serving their purposes",
+                "Market volatility creates long-term opportunities",
+                "We may consider rebalancing if conditions persist"
+            ),
+            "behavioral_coaching": "Focus on the benefits of diversification and the long-term perspective.",
+            "closing": "This is exactly why we maintain a balanced approach. Let's stay disciplined and focused on your long-term goals."
+        }),
+        "aggressive": MappingProxyType({
+            "opening": "Given today's market activity, I wanted to discuss how this volatility might present opportunities for your growth-oriented strategy.",
+            "key_points": (
+                "Volatility is often a precursor to strong returns",
+                "Your growth strategy is built for these market cycles",
+                "History shows patient investors are rewarded",
+                "We may have opportunities to add to positions"
+            ),
+            "behavioral_coaching": "Channel their risk appetite into productive long-term thinking.",
+            "closing": "This is exactly the type of environment where growth strategies can excel. Let's stay focused on your wealth-building objectives."
+        })
+    }),
+    "correction": MappingProxyType({
+        "conservative": MappingProxyType({
+            "opening": "I'm calling about the recent market correction. I want to review how your conservative strategy is protecting your portfolio.",
+            "key_points": (
+                "Market corrections are normal and expected events",
+                "Your allocation significantly limits downside exposure",
+                "Quality bonds and cash are providing stability",
+                "This validates our conservative approach"
+            ),
+            "behavioral_coaching": "Reinforce their wise choice of conservative positioning and provide historical context.",
+            "closing": "Your conservative approach is doing exactly what we intended - protecting your wealth during uncertain times."
+        }),
+        "moderate": MappingProxyType({
+            "opening": "I wanted to discuss the current market correction and how your balanced portfolio is navigating this environment.",
+            "key_points": (
+                "Corrections are healthy parts of long-term market cycles",
+                "Your diversification is limiting the impact",
+                "We're positioned for the eventual recovery",
+                "This may create rebalancing opportunities"
+            ),
+            "behavioral_coaching": "Emphasize the normalcy of corrections and the benefits of staying disciplined.",
+            "closing": "Remember, corrections are often followed by strong recoveries. Your balanced approach positions you well for both."
+        }),
+        "aggressive": MappingProxyType({
+            "opening": "I want to discuss the current market correction and the potential opportunities it's creating for your growth strategy.",
+            "key_points": (
+                "Corrections often create the best long-term opportunities",
+                "Your growth allocation is built for these cycles",
+                "History shows corrections are temporary",
+                "We may consider adding to high-quality positions"
+            ),
+            "behavioral_coaching": "Help them see opportunity in volatility while maintaining long-term perspective.",
+            "closing": "The best long-term returns often come from staying disciplined during corrections like this one."
+        })
+    })
+})
+
+# General coaching points shared by every comfort call
+_GENERAL_COACHING = MappingProxyType({
+    "do_emphasize": (
+        "Long-term perspective and goals",
+        "Portfolio design rationale",
+        "Historical market resilience",
+        "Advisor availability for support"
+    ),
+    "do_not": (
+        "Make predictions about market direction",
+        "Recommend major strategy changes during stress",
+        "Minimize client concerns",
+        "Rush the conversation"
+    ),
+    "red_flags": (
+        "Client wanting to liquidate everything",
+        "Extreme emotional distress",
+        "Mention of financial hardship",
+        "Family pressure to make changes"
+    )
+})
+
+_CALL_OBJECTIVES = (
+    "Provide reassurance and context",
+    "Reinforce portfolio strategy",
+    "Identify any immediate concerns",
+    "Schedule follow-up if needed"
+)
+
+_DEFAULT_OUTREACH_SEGMENTS = ("high_net_worth", "conservative", "moderate", "aggressive")
+
+# Outreach strategy by event severity
+_OUTREACH_STRATEGIES = MappingProxyType({
+    "low": MappingProxyType({
+        "method": "EMAIL",
+        "timeline": "24_HOURS",
+        "priority": "STANDARD",
+        "message_type": "INFORMATIONAL"
+    }),
+    "moderate": MappingProxyType({
+        "method": "EMAIL_AND_PORTAL",
+        "timeline": "4_HOURS",
+        "priority": "ELEVATED",
+        "message_type": "REASSURANCE"
+    }),
+    "high": MappingProxyType({
+        "method": "PHONE_AND_EMAIL",
+        "timeline": "2_HOURS",
+        "priority": "HIGH",
+        "message_type": "COMFORT_CALL"
+    }),
+    "severe": MappingProxyType({
+        "method": "IMMEDIATE_CONTACT",
+        "timeline": "30_MINUTES",
+        "priority": "URGENT",
+        "message_type": "CRISIS_COMMUNICATION"
+    })
+})
+
+_OUTREACH_NEXT_STEPS = (
+    "Execute outreach according to timeline",
+    "Monitor client responses and concerns",
+    "Document all interactions",
+    "Escalate urgent situations",
+    "Report completion metrics"
+)
+
+
+def _state_get(tool_context: Optional[ToolContext], key: str, default: Any = None) -> Any:
+    """Read a session state value, or default when called without a tool context"""
+    return tool_context.state.get(key, default) if tool_context else default
+
+
+def analyze_market_volatility(threshold: float = 5.0, timeframe: str = "1D", detail: bool = True, tool_context: ToolContext = None) -> dict:
     """
     Analyze current market volatility and assess client impact.
     
     Args:
         threshold: Volatility threshold percentage for alerts (default 5.0%)
         timeframe: Analysis timeframe (1D, 1W, 1M)
+        detail: Include the per-index event list; pass False when only the
+            stress level and event count are needed, e.g. when polling
         tool_context: ADK tool context for state management
         
     Returns:
         Dictionary with volatility analysis and client impact assessment
     """
-    market_api = MockMarketDataAPI()
-    
-    # Get current market conditions
-    market_response = market_api.get_market_indices()
-    
-    if not market_response.success:
-        return {
-            "status": "ERROR",
-            "message": f"Failed to retrieve market data: {market_response.error}"
-        }
-    
-    market_data = market_response.data
+    # Get current market conditions, reusing a fetch from earlier in the turn
+    market_data = _MARKET_INDICES_CACHE.get(_MARKET_INDICES_KEY)
+    if market_data is None:
+        market_response = _MARKET_DATA.get_market_indices()
+        
+        if not market_response.success:
+            return {
+                "status": "ERROR",
+                "message": f"Failed to retrieve market data: {market_response.error}"
+            }
+        
+        market_data = market_response.data
+        _MARKET_INDICES_CACHE.set(_MARKET_INDICES_KEY, market_data)
     
-    # Calculate volatility metrics
+    # Calculate volatility metrics, tracking the largest move in the same pass
     volatility_events = []
-    high_volatility_detected = False
+    event_count = 0
+    max_abs_change = 0.0
     
     for index, data in market_data.items():
         daily_change = data.get("daily_change_percent", 0)
-        if abs(daily_change) >= threshold:
-            high_volatility_detected = True
-            volatility_events.append({
-                "index": index,
-                "change_percent": daily_change,
-                "current_price": data.get("current_price", 0),
-                "volatility_level": "HIGH" if abs(daily_change) >= 10 else "ELEVATED"
-            })
+        abs_change = abs(daily_change)
+        if abs_change >= threshold:
+            event_count += 1
+            if abs_change > max_abs_change:
+                max_abs_change = abs_change
+            if detail:
+                volatility_events.append({
+                    "index": index,
+                    "change_percent": daily_change,
+                    "current_price": data.get("current_price", 0),
+                    "volatility_level": "HIGH" if abs_change >= 10 else "ELEVATED"
+                })
+    high_volatility_detected = event_count > 0
     
     # Determine overall market stress level
-    if high_volatility_detected:
-        if any(abs(event["change_percent"]) >= 10 for event in volatility_events):
-            stress_level = "SEVERE"
-            recommended_action = "IMMEDIATE_CLIENT_OUTREACH"
-        elif any(abs(event["change_percent"]) >= 7 for event in volatility_events):
-            stress_level = "HIGH"
-            recommended_action = "PROACTIVE_COMMUNICATION"
-        else:
-            stress_level = "MODERATE"
-            recommended_action = "MONITOR_AND_PREPARE"
-    else:
+    if not high_volatility_detected:
         stress_level = "NORMAL"
         recommended_action = "ROUTINE_MONITORING"
+    elif max_abs_change >= 10:
+        stress_level = "SEVERE"
+        recommended_action = "IMMEDIATE_CLIENT_OUTREACH"
+    elif max_abs_change >= 7:
+        stress_level = "HIGH"
+        recommended_action = "PROACTIVE_COMMUNICATION"
+    else:
+        stress_level = "MODERATE"
+        recommended_action = "MONITOR_AND_PREPARE"
     
     # Store market analysis in context
+    analysis_timestamp = datetime.now().isoformat()
     if tool_context:
-        tool_context.state["last_market_analysis"] = {
-            "timestamp": datetime.now().isoformat(),
-            "stress_level": stress_level,
-            "volatility_events": volatility_events
+        last_analysis = {
+            "timestamp": analysis_timestamp,
+            "stress_level": stress_level
         }
+        if detail:
+            last_analysis["volatility_events"] = volatility_events
+        else:
+            # Summary polls collect no events; keep those from the last detailed run
+            last_analysis = {**_state_get(tool_context, "last_market_analysis", {}), **last_analysis}
+        tool_context.state["last_market_analysis"] = last_analysis
     
     return {
         "status": "SUCCESS",
-        "analysis_timestamp": datetime.now().isoformat(),
+        "analysis_timestamp": analysis_timestamp,
         "timeframe": timeframe,
         "threshold_used": f"{threshold}%",
         "stress_level": stress_level,
         "high_volatility_detected": high_volatility_detected,
-        "volatility_events": volatility_events,
+        "volatility_events": volatility_events if detail else None,
+        "events_detected": event_count,
         "recommended_action": recommended_action,
         "client_impact_assessment": "Market volatility may affect client portfolios. Review high-risk clients first.",
-        "message": f"Market analysis complete. Stress level: {stress_level}, Events detected: {len(volatility_events)}"
+        "message": f"Market analysis complete. Stress level: {stress_level}, Events detected: {event_count}"
     }
 
 
@@ -99,70 +331,27 @@ def generate_market_commentary(event_type: str, client_segments: Optional[List[s
         Dictionary with customized market commentary for each segment
     """
     if client_segments is None:
-        client_segments = ["conservative", "moderate", "aggressive"]
-    
-    # Get current market analysis if available
-    last_analysis = {}
-    if tool_context:
-        last_analysis = tool_context.state.get("last_market_analysis", {})
+        client_segments = _DEFAULT_COMMENTARY_SEGMENTS
     
-    # Generate commentary templates based on event type
-    commentary_templates = {
-        "volatility": {
-            "conservative": {
-                "headline": "Market Volatility Update - Your Portfolio Remains Stable",
-                "message": "While today's market movements may seem concerning, your conservative portfolio allocation is designed to weather these periods of volatility. Your bond and cash positions provide stability during uncertain times.",
-                "action_items": ["Review your emergency fund adequacy", "Consider this an opportunity to discuss rebalancing", "Maintain long-term perspective"]
-            },
-            "moderate": {
-                "headline": "Market Volatility - Staying the Course",
-                "message": "Today's market volatility is a reminder of why we maintain a balanced approach to your investments. Your diversified portfolio is positioned to capture long-term growth while managing downside risk.",
-                "action_items": ["Review portfolio allocation", "Consider tax-loss harvesting opportunities", "Maintain disciplined investment approach"]
-            },
-            "aggressive": {
-                "headline": "Market Volatility Creates Opportunities",
-                "message": "While market volatility can be unsettling, history shows these periods often present long-term investment opportunities. Your growth-focused strategy is built to capitalize on market cycles.",
-                "action_items": ["Consider additional investment opportunities", "Review risk tolerance", "Focus on long-term wealth building goals"]
-            }
-        },
-        "correction": {
-            "conservative": {
-                "headline": "Market Correction - Your Conservative Strategy Provides Protection",
-                "message": "Market corrections are normal parts of market cycles. Your conservative allocation significantly limits your exposure to this downturn while preserving capital for future opportunities.",
-                "action_items": ["Review cash flow needs", "Consider defensive positioning", "Prepare for potential rebalancing"]
-            },
-            "moderate": {
-                "headline": "Navigating the Market Correction",
-                "message": "Market corrections, while uncomfortable, are normal and expected events. Your balanced portfolio is designed to participate in recoveries while limiting downside exposure during corrections like this one.",
-                "action_items": ["Stay disciplined with investment plan", "Consider rebalancing opportunities", "Review and reaffirm long-term goals"]
-            },
-            "aggressive": {
-                "headline": "Market Correction Presents Long-Term Opportunities", 
-                "message": "Market corrections often create excellent long-term investment opportunities. While short-term volatility is challenging, your growth strategy positions you to benefit from eventual market recovery.",
-                "action_items": ["Consider increasing equity positions", "Review dollar-cost averaging opportunities", "Maintain focus on long-term wealth creation"]
-            }
-        }
-    }
+    # Get current market stress level if an analysis is available
+    last_analysis = _state_get(tool_context, "last_market_analysis")
+    market_context = last_analysis.get("stress_level", "UNKNOWN") if last_analysis else "UNKNOWN"
     
     # Get appropriate template
-    event_templates = commentary_templates.get(event_type, commentary_templates["volatility"])
+    event_templates = _COMMENTARY_TEMPLATES.get(event_type, _COMMENTARY_TEMPLATES["volatility"])
     
-    # Generate commentary for each segment
-    generated_commentary = {}
-    for segment in client_segments:
-        template = event_templates.get(segment, event_templates["moderate"])
-        
-        # Customize with current market data
-        commentary = {
+    # Generate commentary for each segment, customized with current market data
+    generated_timestamp = datetime.now().isoformat()
+    default_template = event_templates["moderate"]
+    generated_commentary = {
+        segment: {
             "segment": segment,
-            "headline": template["headline"],
-            "message": template["message"],
-            "action_items": template["action_items"],
-            "market_context": last_analysis.get("stress_level", "UNKNOWN"),
-            "generated_timestamp": datetime.now().isoformat()
+            **event_templates.get(segment, default_template),
+            "market_context": market_context,
+            "generated_timestamp": generated_timestamp
         }
-        
-        generated_commentary[segment] = commentary
+        for segment in client_segments
+    }
     
     return {
         "status": "SUCCESS",
@@ -174,13 +363,15 @@ def generate_market_commentary(event_type: str, client_segments: Optional[List[s
     }
 
 
-def assess_portfolio_impact(market_event: str, client_account: Optional[str] = None, tool_context: ToolContext = None) -> dict:
+def assess_portfolio_impact(market_event: str, client_account: Optional[str] = None, detail: bool = True, tool_context: ToolContext = None) -> dict:
     """
     Assess the impact of market events on specific client portfolios.
     
     Args:
         market_event: Type of market event (volatility, correction, crash)
         client_account: Optional client account ID (uses remembered account if not provided)
+        detail: Include the per-position breakdown; pass False when only the
+            portfolio summary and risk level are needed, which is much cheaper
         tool_context: ADK tool context for state management
         
     Returns:
@@ -198,18 +389,18 @@ def assess_portfolio_impact(market_event: str, client_account: Optional[str] = N
                 "available_accounts": account_context.get("available_accounts", [])
             }
     
-    custodian_api = MockCustodianAPI()
-    market_api = MockMarketDataAPI()
-    
-    # Get portfolio data
-    portfolio_response = custodian_api.get_positions(client_account)
-    if not portfolio_response.success:
-        return {
-            "status": "ERROR",
-            "message": f"Failed to retrieve portfolio data: {portfolio_response.error}"
-        }
-    
-    portfolio_data = portfolio_response.data
+    # Get portfolio data, reusing a recent fetch for the same account
+    portfolio_data = _POSITIONS_CACHE.get(client_account)
+    if portfolio_data is None:
+        portfolio_response = _CUSTODIAN.get_positions(client_account)
+        if not portfolio_response.success:
+            return {
+                "status": "ERROR",
+                "message": f"Failed to retrieve portfolio data: {portfolio_response.error}"
+            }
+        
+        portfolio_data = portfolio_response.data
+        _POSITIONS_CACHE.set(client_account, portfolio_data)
     positions = portfolio_data.get("positions", [])
     
     # Calculate impact by position
@@ -217,14 +408,15 @@ def assess_portfolio_impact(market_event: str, client_account: Optional[str] = N
     total_portfolio_value = 0
     total_estimated_impact = 0
     
-    # Define impact factors by event type
-    impact_factors = {
-        "volatility": {"stocks": -0.02, "bonds": -0.005, "cash": 0.0},  # 2% stocks, 0.5% bonds
-        "correction": {"stocks": -0.12, "bonds": -0.02, "cash": 0.0},   # 12% stocks, 2% bonds  
-        "crash": {"stocks": -0.25, "bonds": -0.05, "cash": 0.0}        # 25% stocks, 5% bonds
-    }
+    event_factors = _IMPACT_FACTORS.get(market_event, _IMPACT_FACTORS["volatility"])
     
-    event_factors = impact_factors.get(market_event, impact_factors["volatility"])
+    # Every position of a type gets the same percentage, so label each type once
+    impact_percentages = {
+        position_type: _fmt_signed_pct(factor * 100) for position_type, factor in event_factors.items()
+    }
+    # Bound once for the position loop
+    add_impact = impact_analysis.append
+    position_type_of = _POSITION_TYPES.get
     
     for position in positions:
         symbol = position.get("symbol", "")
@@ -232,26 +424,20 @@ def assess_portfolio_impact(market_event: str, client_account: Optional[str] = N
         total_portfolio_value += market_value
         
         # Classify position type (simplified)
-        if symbol in ["BND", "VGIT", "TLT"]:
-            position_type = "bonds"
-            impact_factor = event_factors["bonds"]
-        elif symbol in ["CASH", "VMOT"]:
-            position_type = "cash"
-            impact_factor = event_factors["cash"]
-        else:
-            position_type = "stocks"
-            impact_factor = event_factors["stocks"]
+        position_type = position_type_of(symbol, "stocks")
+        impact_factor = event_factors[position_type]
         
         estimated_impact = market_value * impact_factor
         total_estimated_impact += estimated_impact
         
-        impact_analysis.append({
-            "symbol": symbol,
-            "position_type": position_type,
-            "current_value": f"${market_value:,.2f}",
-            "estimated_impact": f"${estimated_impact:+,.2f}",
-            "impact_percentage": f"{impact_factor * 100:+.1f}%"
-        })
+        if detail:
+            add_impact({
+                "symbol": symbol,
+                "position_type": position_type,
+                "current_value": _fmt_usd(market_value),
+                "estimated_impact": _fmt_signed_usd(estimated_impact),
+                "impact_percentage": impact_percentages[position_type]
+            })
     
     # Calculate overall impact metrics
     portfolio_impact_percent = (total_estimated_impact / total_portfolio_value * 100) if total_portfolio_value > 0 else 0
@@ -273,13 +459,13 @@ def assess_portfolio_impact(market_event: str, client_account: Optional[str] = N
         "market_event": market_event,
         "analysis_timestamp": datetime.now().isoformat(),
         "portfolio_summary": {
-            "total_value": f"${total_portfolio_value:,.2f}",
-            "estimated_impact": f"${total_estimated_impact:+,.2f}",
+            "total_value": _fmt_usd(total_portfolio_value),
+            "estimated_impact": _fmt_signed_usd(total_estimated_impact),
             "impact_percentage": f"{portfolio_impact_percent:+.2f}%"
         },
         "risk_level": risk_level,
         "recommended_action": recommended_action,
-        "position_analysis": impact_analysis,
+        "position_analysis": impact_analysis if detail else None,
         "message": f"Portfolio impact analysis complete. Risk level: {risk_level}"
     }
 
@@ -296,118 +482,17 @@ def create_comfort_call_scripts(market_condition: str, risk_tolerance: str = "mo
     Returns:
         Dictionary with scripted talking points and coaching guidance
     """
-    # Define comfort call scripts by condition and risk tolerance
-    call_scripts = {
-        "volatile": {
-            "conservative": {
-                "opening": "I'm calling to check in with you regarding today's market activity. I know you prefer a conservative approach, and I want to reassure you about your portfolio positioning.",
-                "key_points": [
-                    "Your portfolio is heavily weighted toward stable investments",
-                    "Bond and cash positions are providing stability during this volatility", 
-                    "This type of market movement is normal and expected",
-                    "Your conservative allocation is protecting your capital"
-                ],
-                "behavioral_coaching": "Acknowledge their concerns and emphasize the protective nature of their conservative strategy.",
-                "closing": "Remember, we built your portfolio specifically to weather periods like this. I'm here if you have any concerns."
-            },
-            "moderate": {
-                "opening": "I wanted to reach out regarding today's market movements and discuss how your balanced portfolio is positioned during this volatility.",
-                "key_points": [
-                    "Your diversified approach is working as designed",
-                    "Both growth and defensive positions are serving their purposes",
-                    "Market volatility creates long-term opportunities",
-                    "We may consider rebalancing if conditions persist"
-                ],
-                "behavioral_coaching": "Focus on the benefits of diversification and the long-term perspective.",
-                "closing": "This is exactly why we maintain a balanced approach. Let's stay disciplined and focused on your long-term goals."
-            },
-            "aggressive": {
-                "opening": "Given today's market activity, I wanted to discuss how this volatility might present opportunities for your growth-oriented strategy.",
-                "key_points": [
-                    "Volatility is often a precursor to strong returns",
-                    "Your growth strategy is built for these market cycles",
-                    "History shows patient investors are rewarded",
-                    "We may have opportunities to add to positions"
-                ],
-                "behavioral_coaching": "Channel their risk appetite into productive long-term thinking.",
-                "closing": "This is exactly the type of environment where growth strategies can excel. Let's stay focused on your wealth-building objectives."
-            }
-        },
-        "correction": {
-            "conservative": {
-                "opening": "I'm calling about the recent market correction. I want to review how your conservative strategy is protecting your portfolio.",
-                "key_points": [
-                    "Market corrections are normal and expected events",
-                    "Your allocation significantly limits downside exposure",
-                    "Quality bonds and cash are providing stability",
-                    "This validates our conservative approach"
-                ],
-                "behavioral_coaching": "Reinforce their wise choice of conservative positioning and provide historical context.",
-                "closing": "Your conservative approach is doing exactly what we intended - protecting your wealth during uncertain times."
-            },
-            "moderate": {
-                "opening": "I wanted to discuss the current market correction and how your balanced portfolio is navigating this environment.",
-                "key_points": [
-                    "Corrections are healthy parts of long-term market cycles", 
-                    "Your diversification is limiting the impact",
-                    "We're positioned for the eventual recovery",
-                    "This may create rebalancing opportunities"
-                ],
-                "behavioral_coaching": "Emphasize the normalcy of corrections and the benefits of staying disciplined.",
-                "closing": "Remember, corrections are often followed by strong recoveries. Your balanced approach positions you well for both."
-            },
-            "aggressive": {
-                "opening": "I want to discuss the current market correction and the potential opportunities it's creating for your growth strategy.",
-                "key_points": [
-                    "Corrections often create the best long-term opportunities",
-                    "Your growth allocation is built for these cycles",
-                    "History shows corrections are temporary",
-                    "We may consider adding to high-quality positions"
-                ],
-                "behavioral_coaching": "Help them see opportunity in volatility while maintaining long-term perspective.",
-                "closing": "The best long-term returns often come from staying disciplined during corrections like this one."
-            }
-        }
-    }
-    
     # Get appropriate script
-    condition_scripts = call_scripts.get(market_condition, call_scripts["volatile"])
+    condition_scripts = _CALL_SCRIPTS.get(market_condition, _CALL_SCRIPTS["volatile"])
     script = condition_scripts.get(risk_tolerance, condition_scripts["moderate"])
     
-    # Add general coaching points
-    general_coaching = {
-        "do_emphasize": [
-            "Long-term perspective and goals",
-            "Portfolio design rationale", 
-            "Historical market resilience",
-            "Advisor availability for support"
-        ],
-        "do_not": [
-            "Make predictions about market direction",
-            "Recommend major strategy changes during stress",
-            "Minimize client concerns",
-            "Rush the conversation"
-        ],
-        "red_flags": [
-            "Client wanting to liquidate everything",
-            "Extreme emotional distress",
-            "Mention of financial hardship",
-            "Family pressure to make changes"
-        ]
-    }
-    
     return {
         "status": "SUCCESS",
         "market_condition": market_condition,
         "risk_tolerance": risk_tolerance,
-        "call_script": script,
-        "coaching_guidance": general_coaching,
-        "call_objectives": [
-            "Provide reassurance and context",
-            "Reinforce portfolio strategy",
-            "Identify any immediate concerns",
-            "Schedule follow-up if needed"
-        ],
+        "call_script": dict(script),
+        "coaching_guidance": dict(_GENERAL_COACHING),
+        "call_objectives": _CALL_OBJECTIVES,
         "message": f"Comfort call script prepared for {risk_tolerance} risk tolerance client during {market_condition} conditions"
     }
 
@@ -425,56 +510,32 @@ def trigger_proactive_outreach(event_severity: str, client_segments: Optional[Li
         Dictionary with outreach plan and execution details
     """
     if client_segments is None:
-        client_segments = ["high_net_worth", "conservative", "moderate", "aggressive"]
-    
-    # Define outreach strategies by severity
-    outreach_strategies = {
-        "low": {
-            "method": "EMAIL",
-            "timeline": "24_HOURS",
-            "priority": "STANDARD",
-            "message_type": "INFORMATIONAL"
-        },
-        "moderate": {
-            "method": "EMAIL_AND_PORTAL",
-            "timeline": "4_HOURS", 
-            "priority": "ELEVATED",
-            "message_type": "REASSURANCE"
-        },
-        "high": {
-            "method": "PHONE_AND_EMAIL",
-            "timeline": "2_HOURS",
-            "priority": "HIGH",
-            "message_type": "COMFORT_CALL"
-        },
-        "severe": {
-            "method": "IMMEDIATE_CONTACT",
-            "timeline": "30_MINUTES",
-            "priority": "URGENT",
-            "message_type": "CRISIS_COMMUNICATION"
-        }
-    }
+        client_segments = _DEFAULT_OUTREACH_SEGMENTS
     
-    strategy = outreach_strategies.get(event_severity, outreach_strategies["moderate"])
+    strategy = _OUTREACH_STRATEGIES.get(event_severity, _OUTREACH_STRATEGIES["moderate"])
     
     # Generate outreach plan by segment
-    outreach_plan = []
-    for segment in client_segments:
-        segment_plan = {
+    method, timeline, priority, message_type = (
+        strategy["method"], strategy["timeline"], strategy["priority"], strategy["message_type"]
+    )
+    outreach_plan = [
+        {
             "client_segment": segment,
-            "outreach_method": strategy["method"],
-            "timeline": strategy["timeline"],
-            "priority_level": strategy["priority"],
-            "message_type": strategy["message_type"],
+            "outreach_method": method,
+            "timeline": timeline,
+            "priority_level": priority,
+            "message_type": message_type,
             "estimated_clients": 25 if segment == "high_net_worth" else 75,  # Mock numbers
             "assigned_team": "Senior Advisor" if segment == "high_net_worth" else "Advisory Team"
         }
-        outreach_plan.append(segment_plan)
+        for segment in client_segments
+    ]
     
     # Store outreach execution in context
+    campaign_timestamp = datetime.now().isoformat()
     if tool_context:
         tool_context.state["active_outreach_campaign"] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": campaign_timestamp,
             "event_severity": event_severity,
             "outreach_plan": outreach_plan,
             "status": "INITIATED"
@@ -485,22 +546,16 @@ def trigger_proactive_outreach(event_severity: str, client_segments: Optional[Li
     
     return {
         "status": "SUCCESS",
-        "campaign_initiated": datetime.now().isoformat(),
+        "campaign_initiated": campaign_timestamp,
         "event_severity": event_severity,
-        "outreach_strategy": strategy,
+        "outreach_strategy": dict(strategy),
         "outreach_plan": outreach_plan,
         "execution_summary": {
             "total_client_segments": len(client_segments),
             "estimated_total_clients": total_clients,
-            "execution_timeline": strategy["timeline"],
-            "priority_level": strategy["priority"]
+            "execution_timeline": timeline,
+            "priority_level": priority
         },
-        "next_steps": [
-            "Execute outreach according to timeline",
-            "Monitor client responses and concerns",
-            "Document all interactions",
-            "Escalate urgent situations",
-            "Report completion metrics"
-        ],
+        "next_steps": _OUTREACH_NEXT_STEPS,
         "message": f"Proactive outreach campaign initiated for {event_severity} severity event affecting {total_clients} estimated clients"
     }
\ No newline at end of file
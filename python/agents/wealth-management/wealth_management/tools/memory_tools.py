@@ -15,8 +15,10 @@ def remember_account(account_id: str, tool_context: ToolContext) -> dict:
     Returns:
         Dictionary confirming account has been remembered
     """
-    tool_context.state["primary_account_id"] = account_id
-    tool_context.state["last_account_accessed"] = account_id
+    tool_context.state.update({
+        "primary_account_id": account_id,
+        "last_account_accessed": account_id
+    })
     
     return {
         "status": "SUCCESS",
@@ -67,10 +69,13 @@ def store_user_preference(key: str, value: str, tool_context: ToolContext) -> di
     Returns:
         Dictionary confirming preference has been stored
     """
-    if "user_preferences" not in tool_context.state:
-        tool_context.state["user_preferences"] = {}
-    
-    tool_context.state["user_preferences"][key] = value
+    # Write back a new dict rather than mutating the stored one in place: only
+    # top-level assignments reach the session's state delta, so an in-place
+    # edit would be lost under a persistent (database / Agent Engine) session
+    # service or on another replica
+    preferences = dict(tool_context.state.get("user_preferences", {}))
+    preferences[key] = value
+    tool_context.state["user_preferences"] = preferences
     
     return {
         "status": "SUCCESS",
@@ -111,10 +116,10 @@ def store_conversation_context(context_type: str, context_data: Dict[str, Any],
     Returns:
         Dictionary confirming context has been stored
     """
-    if "conversation_context" not in tool_context.state:
-        tool_context.state["conversation_context"] = {}
-    
-    tool_context.state["conversation_context"][context_type] = context_data
+    # Copy-on-write for the same reason as store_user_preference
+    conversation_context = dict(tool_context.state.get("conversation_context", {}))
+    conversation_context[context_type] = context_data
+    tool_context.state["conversation_context"] = conversation_context
     
     return {
         "status": "SUCCESS",
@@ -162,16 +167,20 @@ def initialize_user_session(user_id: str, primary_account_id: Optional[str] = No
     Returns:
         Dictionary confirming session initialization
     """
-    tool_context.state["user_id"] = user_id
-    tool_context.state["session_initialized"] = True
+    session_state = {
+        "user_id": user_id,
+        "session_initialized": True,
+        # Initialize empty containers
+        "user_preferences": {},
+        "conversation_context": {}
+    }
     
     if primary_account_id:
-        tool_context.state["primary_account_id"] = primary_account_id
-        tool_context.state["last_account_accessed"] = primary_account_id
+        session_state["primary_account_id"] = primary_account_id
+        session_state["last_account_accessed"] = primary_account_id
     
-    # Initialize empty containers
-    tool_context.state["user_preferences"] = {}
-    tool_context.state["conversation_context"] = {}
+    # One batched write into the session's state delta
+    tool_context.state.update(session_state)
     
     return {
         "status": "SUCCESS",
@@ -191,14 +200,16 @@ def get_session_summary(tool_context: ToolContext) -> dict:
     Returns:
         Dictionary with session summary
     """
+    state = tool_context.state
+    
     return {
         "status": "SUCCESS",
         "session_data": {
-            "user_id": tool_context.state.get("user_id"),
-            "primary_account_id": tool_context.state.get("primary_account_id"),
-            "last_account_accessed": tool_context.state.get("last_account_accessed"),
-            "preferences_count": len(tool_context.state.get("user_preferences", {})),
-            "context_types": list(tool_context.state.get("conversation_context", {}).keys()),
-            "session_initialized": tool_context.state.get("session_initialized", False)
+            "user_id": state.get("user_id"),
+            "primary_account_id": state.get("primary_account_id"),
+            "last_account_accessed": state.get("last_account_accessed"),
+            "preferences_count": len(state.get("user_preferences", {})),
+            "context_types": list(state.get("conversation_context", {})),
+            "session_initialized": state.get("session_initialized", False)
         }
     }
\ No newline at end of file
@@ -1,13 +1,94 @@
 """Tools for portfolio dashboard agent with context management"""
 
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from google.adk.tools import ToolContext
 from ..mock_apis import MockCustodianAPI, MockMarketDataAPI
+from ..mock_apis.base_api import APIResponse
 from ..shared_libraries import PortfolioAnalyzer, FinancialCalculator
+from ..shared_libraries.cache_utils import API_CACHE_TTL_SECONDS, TTLCache
 from .memory_tools import get_current_account, remember_account
 
+# Shared API clients, created once instead of on every tool call
+_CUSTODIAN = MockCustodianAPI()
+_MARKET_DATA = MockMarketDataAPI()
+
+# Successful API responses, so the dashboard tools a single agent turn fans
+# out to share one round trip per account or symbol. Cached responses and
+# their data are shared by reference and must be treated as read-only.
+_ACCOUNT_INFO_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS, maxsize=512)
+_POSITIONS_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS, maxsize=512)
+_QUOTE_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS, maxsize=512)
+_MARKET_INDICES_KEY = "indices"
+_MARKET_INDICES_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS, maxsize=1)
+
+# (positions response, {symbol: position}) per account, rebuilt only when the
+# positions response itself is refetched
+_POSITION_INDEX_CACHE = TTLCache(ttl_seconds=API_CACHE_TTL_SECONDS, maxsize=512)
+
+# Bound once for the per-position figures in generate_allocation_charts
+_fmt_usd = "${:,.2f}".format
+_fmt_alloc_pct = "{:.2f}%".format
+
+
+def _clear_cache() -> None:
+    """Drop every cached API response and position index"""
+    for cache in (_ACCOUNT_INFO_CACHE, _POSITIONS_CACHE, _POSITION_INDEX_CACHE,
+                  _QUOTE_CACHE, _MARKET_INDICES_CACHE):
+        cache.clear()
+
+
+def _cached_response(cache: TTLCache, key: str, fetch, *args) -> APIResponse:
+    """
+    Serve key from cache, calling fetch(*args) on a miss; failed responses are not cached.
+    
+    The returned response is shared with later callers, so its data must not be mutated.
+    """
+    response = cache.get(key)
+    if response is None:
+        response = fetch(*args)
+        if response.success:
+            cache.set(key, response)
+    return response
+
+
+def _account_info(account_id: str) -> APIResponse:
+    """Account info for account_id, cached"""
+    return _cached_response(_ACCOUNT_INFO_CACHE, account_id, _CUSTODIAN.get_account_info, account_id)
+
+
+def _positions(account_id: str) -> APIResponse:
+    """Positions for account_id, cached"""
+    return _cached_response(_POSITIONS_CACHE, account_id, _CUSTODIAN.get_positions, account_id)
+
+
+def _positions_by_symbol(account_id: str) -> Tuple[APIResponse, Dict[str, Dict[str, Any]]]:
+    """Positions response for account_id plus its positions indexed by symbol"""
+    response = _positions(account_id)
+    if not response.success:
+        return response, {}
+    
+    cached = _POSITION_INDEX_CACHE.get(account_id)
+    if cached is not None and cached[0] is response:
+        return cached
+    
+    # Reversed so the first position listed wins, as the old linear scan did
+    positions = response.data.get("positions", [])
+    index = {pos["symbol"]: pos for pos in reversed(positions) if pos.get("symbol")}
+    _POSITION_INDEX_CACHE.set(account_id, (response, index))
+    return response, index
+
+
+def _quote(symbol: str) -> APIResponse:
+    """Quote for symbol, cached"""
+    return _cached_response(_QUOTE_CACHE, symbol, _MARKET_DATA.get_quote, symbol)
+
+
+def _market_indices() -> APIResponse:
+    """Major market indices, cached"""
+    return _cached_response(_MARKET_INDICES_CACHE, _MARKET_INDICES_KEY, _MARKET_DATA.get_market_indices)
+
 
 def get_portfolio_summary(account_id: Optional[str] = None, tool_context: ToolContext = None) -> dict:
     """
@@ -36,11 +117,9 @@ def get_portfolio_summary(account_id: Optional[str] = None, tool_context: ToolCo
     # Remember this account for future use
     if account_id and tool_context:
         remember_account(account_id, tool_context)
-    custodian_api = MockCustodianAPI()
-    market_api = MockMarketDataAPI()
     
     # Get account information
-    account_response = custodian_api.get_account_info(account_id)
+    account_response = _account_info(account_id)
     if not account_response.success:
         return {
             "status": "ERROR",
@@ -50,7 +129,7 @@ def get_portfolio_summary(account_id: Optional[str] = None, tool_context: ToolCo
     account_info = account_response.data
     
     # Get current positions
-    positions_response = custodian_api.get_positions(account_id)
+    positions_response = _positions(account_id)
     if not positions_response.success:
         return {
             "status": "ERROR", 
@@ -64,8 +143,8 @@ def get_portfolio_summary(account_id: Optional[str] = None, tool_context: ToolCo
     portfolio_performance = PortfolioAnalyzer.calculate_portfolio_performance(positions)
     
     # Get market context
-    market_indices = market_api.get_market_indices()
-    market_status = market_api.is_market_open()
+    market_indices = _market_indices()
+    market_status = _MARKET_DATA.is_market_open()
     
     # Calculate daily change (mock calculation)
     total_value = portfolio_performance.get("total_market_value", 0)
@@ -117,21 +196,15 @@ def get_position_details(symbol: str, account_id: Optional[str] = None, tool_con
                 "available_accounts": account_context.get("available_accounts", [])
             }
     # Get fresh positions data
-    custodian_api = MockCustodianAPI()
-    positions_response = custodian_api.get_positions(account_id)
+    positions_response, positions_by_symbol = _positions_by_symbol(account_id)
     if not positions_response.success:
         return {
             "status": "ERROR",
             "message": f"Failed to retrieve positions: {positions_response.error}"
         }
-    positions = positions_response.data.get("positions", [])
     
     # Find the specific position
-    position = None
-    for pos in positions:
-        if pos.get("symbol") == symbol:
-            position = pos
-            break
+    position = positions_by_symbol.get(symbol)
     
     if not position:
         return {
@@ -140,8 +213,7 @@ def get_position_details(symbol: str, account_id: Optional[str] = None, tool_con
         }
     
     # Get current market data
-    market_api = MockMarketDataAPI()
-    quote_response = market_api.get_quote(symbol)
+    quote_response = _quote(symbol)
     current_price = 0
     daily_change = 0
     daily_change_pct = 0
@@ -200,11 +272,10 @@ def calculate_performance_metrics(period: str = "1Y", account_id: Optional[str]
                 "message": f"No account specified for {period} performance analysis. Please provide an account ID.",
                 "available_accounts": account_context.get("available_accounts", [])
             }
-    custodian_api = MockCustodianAPI()
     
     # Get account transactions for performance calculation
     try:
-        transactions_response = custodian_api.get_transactions(account_id)
+        transactions_response = _CUSTODIAN.get_transactions(account_id)
         if not transactions_response.success:
             return {
                 "status": "ERROR",
@@ -214,7 +285,7 @@ def calculate_performance_metrics(period: str = "1Y", account_id: Optional[str]
         transactions = transactions_response.data.get("transactions", [])
         
         # Get current positions
-        positions_response = custodian_api.get_positions(account_id)
+        positions_response = _positions(account_id)
         if not positions_response.success:
             return {
                 "status": "ERROR",
@@ -276,10 +347,9 @@ def generate_allocation_charts(account_id: Optional[str] = None, tool_context: T
                 "message": "No account specified for allocation analysis. Please provide an account ID.",
                 "available_accounts": account_context.get("available_accounts", [])
             }
-    custodian_api = MockCustodianAPI()
     
     # Get current positions
-    positions_response = custodian_api.get_positions(account_id)
+    positions_response = _positions(account_id)
     if not positions_response.success:
         return {
             "status": "ERROR",
@@ -297,21 +367,21 @@ def generate_allocation_charts(account_id: Optional[str] = None, tool_context: T
         }
     
     # Calculate allocation percentages
-    total_value = sum(pos.get("market_value", 0) for pos in positions)
+    market_values = [pos.get("market_value", 0) for pos in positions]
+    total_value = sum(market_values)
+    pct_scale = 100.0 / total_value if total_value > 0 else 0.0
     
-    allocations = []
-    for position in positions:
-        market_value = position.get("market_value", 0)
-        allocation_pct = (market_value / total_value * 100) if total_value > 0 else 0
-        
-        allocations.append({
-            "symbol": position.get("symbol", ""),
-            "market_value": f"${market_value:,.2f}",
-            "allocation_pct": f"{allocation_pct:.2f}%"
-        })
-    
-    # Sort by allocation percentage descending
-    allocations.sort(key=lambda x: float(x["allocation_pct"].rstrip('%')), reverse=True)
+    # Sort by allocation descending on the raw values, then format once per
+    # position instead of re-parsing the formatted percentage strings
+    order = sorted(range(len(positions)), key=market_values.__getitem__, reverse=True)
+    allocations = [
+        {
+            "symbol": positions[i].get("symbol", ""),
+            "market_value": _fmt_usd(market_values[i]),
+            "allocation_pct": _fmt_alloc_pct(market_values[i] * pct_scale)
+        }
+        for i in order
+    ]
     
     return {
         "status": "SUCCESS",